@@ -1,6 +1,16 @@
 """Coding agent handoff module."""
 
-from revis.agents.base import CodingAgent
-from revis.agents.detect import detect_coding_agent, get_coding_agent
+__all__ = ["CodingAgent", "clear_which_cache", "detect_coding_agent", "get_coding_agent"]
 
-__all__ = ["CodingAgent", "detect_coding_agent", "get_coding_agent"]
+
+def __getattr__(name: str):
+    # Resolve exports lazily so importing the package doesn't load every agent
+    if name == "CodingAgent":
+        from revis.agents import base
+
+        return base.CodingAgent
+    if name in ("clear_which_cache", "detect_coding_agent", "get_coding_agent"):
+        from revis.agents import detect
+
+        return getattr(detect, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
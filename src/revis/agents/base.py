@@ -1,18 +1,60 @@
 """CodingAgent protocol and context for handoffs."""
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from typing import Protocol
 
 
-@dataclass
+async def _git_changed_files_async() -> list[str]:
+    """List files with unstaged changes via `git diff --name-only` without blocking the loop."""
+    import asyncio
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "diff",
+            "--name-only",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        files = [name async for line in proc.stdout if (name := line.decode().strip())]
+        await proc.wait()
+        return files if proc.returncode == 0 else []
+    except Exception:
+        return []
+
+
+@dataclass(frozen=True)
 class HandoffContext:
-    """Context passed to coding agents during handoff."""
+    """Context passed to coding agents during handoff.
+
+    Frozen and hashable so prompts built from it can be cached; list arguments
+    are stored as tuples and metrics are keyed by their serialized form.
+    """
 
     iteration_history: str
-    latest_metrics: dict[str, float]
+    latest_metrics: dict[str, float] = field(compare=False)
     suggestion: str
-    relevant_files: list[str]
-    constraints: list[str] | None = None
+    relevant_files: tuple[str, ...]
+    constraints: tuple[str, ...] | None = None
+    timeout_seconds: float | None = 600.0
+    metrics_json: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "relevant_files", tuple(self.relevant_files))
+        if self.constraints is not None:
+            object.__setattr__(self, "constraints", tuple(self.constraints))
+        object.__setattr__(self, "metrics_json", json.dumps(self.latest_metrics, indent=2))
+
+
+class AgentTimeoutError(TimeoutError):
+    """Raised when a coding agent exceeds its wall-clock limit."""
+
+    def __init__(self, agent: str, elapsed: float, limit: float):
+        self.agent = agent
+        self.elapsed = elapsed
+        self.limit = limit
+        super().__init__(f"{agent} timed out after {elapsed:.1f}s of {limit:g}s")
 
 
 @dataclass
@@ -31,6 +73,9 @@ class CodingAgent(Protocol):
         """
         Execute a handoff to the coding agent.
 
+        Blocking entry point for synchronous callers; must not be called from a
+        running event loop.
+
         Args:
             context: The handoff context with iteration history, metrics, etc.
 
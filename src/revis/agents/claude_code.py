@@ -1,11 +1,17 @@
 """Claude Code agent implementation."""
 
-import json
+import asyncio
+import functools
 import logging
-import shutil
-import subprocess
+import time
 
-from revis.agents.base import HandoffContext, HandoffResult
+from revis.agents.base import (
+    AgentTimeoutError,
+    HandoffContext,
+    HandoffResult,
+    _git_changed_files_async,
+)
+from revis.agents.detect import _which
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +20,23 @@ class ClaudeCodeAgent:
     """Claude Code (claude CLI) agent for code changes."""
 
     def is_available(self) -> bool:
-        return shutil.which("claude") is not None
+        return _which("claude") is not None
 
     def handoff(self, context: HandoffContext) -> HandoffResult:
         """Execute handoff to Claude Code."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "ClaudeCodeAgent.handoff() cannot run inside an event loop; "
+                "await handoff_async() instead"
+            )
+        return asyncio.run(self.handoff_async(context))
+
+    async def handoff_async(self, context: HandoffContext) -> HandoffResult:
+        """Execute handoff to Claude Code without blocking the event loop."""
         if not self.is_available():
             return HandoffResult(
                 success=False,
@@ -28,32 +47,26 @@ class ClaudeCodeAgent:
         prompt = self._build_prompt(context)
 
         try:
-            result = subprocess.run(
-                ["claude", "--print"],
-                input=prompt,
-                text=True,
-                capture_output=True,
-                timeout=600,
-            )
+            returncode = await self._run_claude(prompt, context.timeout_seconds)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 return HandoffResult(
                     success=False,
                     files_changed=[],
-                    error_message=f"claude exited with code {result.returncode}",
+                    error_message=f"claude exited with code {returncode}",
                 )
 
-            changed_files = self._detect_changed_files()
+            changed_files = await _git_changed_files_async()
             return HandoffResult(
                 success=True,
                 files_changed=changed_files,
             )
 
-        except subprocess.TimeoutExpired:
+        except AgentTimeoutError as e:
             return HandoffResult(
                 success=False,
                 files_changed=[],
-                error_message="claude timed out after 10 minutes",
+                error_message=str(e),
             )
         except Exception as e:
             return HandoffResult(
@@ -62,19 +75,42 @@ class ClaudeCodeAgent:
                 error_message=str(e),
             )
 
+    async def _run_claude(self, prompt: str, timeout: float | None) -> int:
+        """Run the claude CLI, killing it if it exceeds the timeout."""
+        started = time.monotonic()
+        proc = await asyncio.create_subprocess_exec(
+            "claude",
+            "--print",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            await asyncio.wait_for(proc.communicate(input=prompt.encode()), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise AgentTimeoutError("claude", time.monotonic() - started, timeout)
+        return proc.returncode
+
     def _build_prompt(self, context: HandoffContext) -> str:
-        metrics_str = json.dumps(context.latest_metrics, indent=2)
-        files_str = "\n".join(f"  - {f}" for f in context.relevant_files)
+        return _build_claude_prompt(context)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_claude_prompt(context: HandoffContext) -> str:
+    """Build the handoff prompt, cached per context."""
+    files_str = "  - " + "\n  - ".join(context.relevant_files) if context.relevant_files else ""
 
-        constraints_section = ""
-        if context.constraints:
-            constraints_str = "\n".join(f"  - {c}" for c in context.constraints)
-            constraints_section = f"""
+    constraints_section = ""
+    if context.constraints:
+        constraints_str = "  - " + "\n  - ".join(context.constraints)
+        constraints_section = f"""
 Constraints:
 {constraints_str}
 """
 
-        return f"""This is an ML training codebase. Revis (an autonomous ML iteration tool) has
+    return f"""This is an ML training codebase. Revis (an autonomous ML iteration tool) has
 determined that code changes are needed to improve training metrics.
 
 ## Iteration History
@@ -82,7 +118,7 @@ determined that code changes are needed to improve training metrics.
 
 ## Current Metrics
 ```json
-{metrics_str}
+{context.metrics_json}
 ```
 
 ## Requested Change
@@ -97,17 +133,3 @@ unrelated code. Focus on the specific change requested.
 
 After making changes, verify they are syntactically correct.
 """
-
-    def _detect_changed_files(self) -> list[str]:
-        """Detect which files were changed by running git diff."""
-        try:
-            result = subprocess.run(
-                ["git", "diff", "--name-only"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                return [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-            return []
-        except Exception:
-            return []
@@ -1,15 +1,93 @@
 """Coding agent detection and factory."""
 
-import shutil
+import functools
+import importlib
+import os
 
 from revis.agents.base import CodingAgent
-from revis.agents.claude_code import ClaudeCodeAgent
+
+# Agent type -> implementing class, imported on first use
+AGENTS = {
+    "claude-code": "revis.agents.claude_code.ClaudeCodeAgent",
+}
+
+# Agent type -> CLI binary, in order of preference
+AGENT_BINARIES = {
+    "claude-code": "claude",
+}
+
+# Environment variables set by agents for the processes they spawn
+AGENT_ENV_MARKERS = {
+    "CLAUDECODE": "claude-code",
+    "CLAUDE_CODE": "claude-code",
+    "CLAUDE_SESSION_ID": "claude-code",
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> str | None:
+    """Cached shutil.which lookup for agent binaries."""
+    import shutil
+
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_path(path: str) -> frozenset[str]:
+    """List entry names across all PATH directories in a single pass.
+
+    Only directory listings are read; callers confirm the executable bit for the
+    names they care about. Keyed on the PATH string so a changed PATH triggers a
+    fresh scan.
+    """
+    pathext = [""]
+    if os.name == "nt":
+        pathext += [ext.lower() for ext in os.environ.get("PATHEXT", "").split(os.pathsep) if ext]
+
+    names: set[str] = set()
+    for directory in path.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+        for entry in entries:
+            lowered = entry.lower()
+            for ext in pathext:
+                if ext and lowered.endswith(ext):
+                    names.add(entry[: -len(ext)])
+                    break
+            else:
+                names.add(entry)
+    return frozenset(names)
+
+
+def path_executables() -> frozenset[str]:
+    """Names of entries on the current PATH, not yet checked for the executable bit."""
+    return _scan_path(os.environ.get("PATH", ""))
+
+
+def clear_which_cache() -> None:
+    """Clear cached binary lookups (e.g. after PATH changes)."""
+    _which.cache_clear()
+    _scan_path.cache_clear()
 
 
 def detect_coding_agent() -> str | None:
-    """Detect available coding agents."""
-    if shutil.which("claude"):
-        return "claude-code"
+    """Detect available coding agents.
+
+    Checks for an invoking agent via environment markers before scanning PATH.
+    """
+    for var, agent_type in AGENT_ENV_MARKERS.items():
+        if os.environ.get(var):
+            return agent_type
+
+    names = path_executables()
+    for agent_type, binary in AGENT_BINARIES.items():
+        # Only the few candidate names get the stat that shutil.which does
+        if binary in names and _which(binary) is not None:
+            return agent_type
     return None
 
 
@@ -32,10 +110,10 @@ def get_coding_agent(agent_type: str) -> CodingAgent | None:
             return None
         agent_type = detected
 
-    if agent_type == "claude-code":
-        agent = ClaudeCodeAgent()
-        if agent.is_available():
-            return agent
+    class_path = AGENTS.get(agent_type)
+    if class_path is None:
         return None
 
-    return None
+    module_name, _, class_name = class_path.rpartition(".")
+    agent = getattr(importlib.import_module(module_name), class_name)()
+    return agent if agent.is_available() else None
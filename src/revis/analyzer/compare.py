@@ -36,6 +36,14 @@ class RunAnalyzer:
         self.store = store
         self.primary_metric = primary_metric
         self.minimize = minimize
+        # Multiplier that turns a raw delta into an improvement (positive = better)
+        self._sign = -1.0 if minimize else 1.0
+        # session_id -> (latest run_id, history)
+        self._history_cache: dict[str, tuple[str, list[float]]] = {}
+
+    def bump(self, session_id: str) -> None:
+        """Invalidate cached history for a session after new metrics are logged."""
+        self._history_cache.pop(session_id, None)
 
     def compare_to_previous(
         self,
@@ -55,11 +63,7 @@ class RunAnalyzer:
             if previous_value is not None:
                 delta_prev = current_value - previous_value
                 if previous_value != 0:
-                    improvement_prev = (
-                        -delta_prev / abs(previous_value)
-                        if self.minimize
-                        else delta_prev / abs(previous_value)
-                    )
+                    improvement_prev = self._sign * delta_prev / abs(previous_value)
 
         baseline_value = None
         delta_base = None
@@ -70,11 +74,7 @@ class RunAnalyzer:
             if baseline_value is not None:
                 delta_base = current_value - baseline_value
                 if baseline_value != 0:
-                    improvement_base = (
-                        -delta_base / abs(baseline_value)
-                        if self.minimize
-                        else delta_base / abs(baseline_value)
-                    )
+                    improvement_base = self._sign * delta_base / abs(baseline_value)
 
         return RunComparison(
             current_value=current_value,
@@ -88,16 +88,15 @@ class RunAnalyzer:
 
     def get_metric_history(self, session_id: str) -> list[float]:
         """Get history of primary metric values for a session."""
-        runs = self.store.query_runs(session_id=session_id, limit=100)
-        history = []
+        latest_run_id = self.store.get_latest_run_id(session_id)
+        cached = self._history_cache.get(session_id)
+        if cached is not None and latest_run_id is not None and cached[0] == latest_run_id:
+            return cached[1]
 
-        for run in reversed(runs):  # Oldest first
-            metrics = self.store.get_run_metrics(run.id)
-            for m in metrics:
-                if m.name == self.primary_metric:
-                    history.append(m.value)
-                    break
+        history = self.store.get_metric_history(session_id, self.primary_metric, limit=100)
 
+        if latest_run_id is not None:
+            self._history_cache[session_id] = (latest_run_id, history)
         return history
 
     def get_initial_value(self, session_id: str) -> float | None:
@@ -120,10 +119,11 @@ class RunAnalyzer:
             from revis.analyzer.detectors import detect_plateau
 
             result = detect_plateau(
-                history + [current_eval.metrics.get(self.primary_metric, 0.0)],
+                history,
                 threshold=0.01,
                 n_runs=3,
                 minimize=self.minimize,
+                new_value=current_eval.metrics.get(self.primary_metric, 0.0),
             )
             plateau_detected = result.triggered
 
@@ -150,11 +150,11 @@ class RunAnalyzer:
         runs = self.store.query_runs(session_id=session_id, limit=limit)
         summaries = []
 
+        metrics_by_run = self.store.get_run_metrics_maps([run.id for run in runs])
         prev_metrics: dict[str, float] = {}
 
         for run in reversed(runs):  # Oldest first
-            metrics_list = self.store.get_run_metrics(run.id)
-            metrics = {m.name: m.value for m in metrics_list}
+            metrics = metrics_by_run[run.id]
 
             # Generate change summary from decisions
             decisions = self.store.get_decisions(run.id)
@@ -163,13 +163,12 @@ class RunAnalyzer:
             # Generate result summary
             result_parts = []
             for name, value in metrics.items():
-                if name in prev_metrics:
-                    delta = value - prev_metrics[name]
-                    pct = (delta / abs(prev_metrics[name]) * 100) if prev_metrics[name] != 0 else 0
+                prev = prev_metrics.get(name)
+                if prev is not None:
+                    delta = value - prev
+                    pct = (delta / abs(prev) * 100) if prev != 0 else 0
                     sign = "+" if delta > 0 else ""
-                    result_parts.append(
-                        f"{name}: {prev_metrics[name]:.4f} → {value:.4f} ({sign}{pct:.1f}%)"
-                    )
+                    result_parts.append(f"{name}: {prev:.4f} → {value:.4f} ({sign}{pct:.1f}%)")
                 else:
                     result_parts.append(f"{name}: {value:.4f}")
 
@@ -192,9 +191,9 @@ def format_run_history(summaries: list[RunSummary]) -> str:
     if not summaries:
         return "No previous runs."
 
-    lines = []
-    for s in summaries:
-        lines.append(f"Run #{s.iteration}: {s.change_summary}")
-        lines.append(f"  Result: {s.result_summary}")
+    lines = [""] * (2 * len(summaries))
+    for i, s in enumerate(summaries):
+        lines[2 * i] = f"Run #{s.iteration}: {s.change_summary}"
+        lines[2 * i + 1] = f"  Result: {s.result_summary}"
 
     return "\n".join(lines)
@@ -3,6 +3,7 @@
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import chain, islice
 
 from revis.config import GuardrailsConfig
 from revis.types import EvalResult
@@ -78,24 +79,33 @@ def detect_plateau(
     threshold: float = 0.01,
     n_runs: int = 3,
     minimize: bool = True,
+    *,
+    new_value: float | None = None,
 ) -> GuardrailResult:
-    """Detect if metric has plateaued (no improvement for N runs)."""
+    """Detect if metric has plateaued (no improvement for N runs).
+
+    If new_value is given it is treated as the latest entry of metric_history,
+    without copying the history to append it.
+    """
+    tail = (new_value,) if new_value is not None else ()
+    total = len(metric_history) + len(tail)
+
     # Need n_runs + 1 to have something to compare against
-    if len(metric_history) <= n_runs:
+    if total <= n_runs:
         return GuardrailResult(
             triggered=False,
             guardrail="plateau_detection",
-            message=f"Not enough history ({len(metric_history)} <= {n_runs} runs)",
+            message=f"Not enough history ({total} <= {n_runs} runs)",
         )
 
-    recent = metric_history[-n_runs:]
-    best_before = min(metric_history[:-n_runs]) if minimize else max(metric_history[:-n_runs])
-    best_recent = min(recent) if minimize else max(recent)
+    # Reduce both windows in place rather than copying them out as slices
+    best = min if minimize else max
+    split = total - n_runs
+    best_before = best(islice(chain(metric_history, tail), split))
+    best_recent = best(islice(chain(metric_history, tail), split, None))
 
-    if minimize:
-        improvement = (best_before - best_recent) / abs(best_before) if best_before != 0 else 0
-    else:
-        improvement = (best_recent - best_before) / abs(best_before) if best_before != 0 else 0
+    sign = -1.0 if minimize else 1.0
+    improvement = sign * (best_recent - best_before) / abs(best_before) if best_before != 0 else 0
 
     if improvement < threshold:
         return GuardrailResult(
@@ -171,12 +181,12 @@ class GuardrailChecker:
         if self.config.plateau_detection_enabled:
             current_value = eval_result.metrics.get(primary_metric)
             if current_value is not None:
-                full_history = metric_history + [current_value]
                 result = detect_plateau(
-                    full_history,
+                    metric_history,
                     self.config.plateau_threshold,
                     self.config.plateau_runs,
                     minimize,
+                    new_value=current_value,
                 )
                 results.append(result)
 
@@ -1,35 +1,90 @@
 """Revis CLI."""
 
+import atexit
+import copy
+import functools
+import importlib.abc
+import importlib.util
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import shlex
 import shutil
 import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-import typer.rich_utils
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.table import Table
-
-from revis.config import get_config_template, load_config, parse_duration
-from revis.store.sqlite import SQLiteRunStore
-from revis.types import Budget
-
-# Override Typer's default "dim" styles which render as dark purple on some terminals
-typer.rich_utils.STYLE_HELPTEXT = ""
-typer.rich_utils.STYLE_OPTION_DEFAULT = "bright_black"
-typer.rich_utils.STYLE_OPTION_ENVVAR = "yellow"
-typer.rich_utils.STYLE_ERRORS_SUGGESTION = ""
-typer.rich_utils.STYLE_METAVAR_SEPARATOR = ""
-typer.rich_utils.STYLE_OPTIONS_PANEL_BORDER = "bright_black"
-typer.rich_utils.STYLE_COMMANDS_PANEL_BORDER = "bright_black"
+
+if TYPE_CHECKING:
+    from revis.store.sqlite import SQLiteRunStore
+
+
+def _override_help_styles(rich_utils) -> None:
+    """Override Typer's default "dim" styles which render as dark purple on some terminals."""
+    rich_utils.STYLE_HELPTEXT = ""
+    rich_utils.STYLE_OPTION_DEFAULT = "bright_black"
+    rich_utils.STYLE_OPTION_ENVVAR = "yellow"
+    rich_utils.STYLE_ERRORS_SUGGESTION = ""
+    rich_utils.STYLE_METAVAR_SEPARATOR = ""
+    rich_utils.STYLE_OPTIONS_PANEL_BORDER = "bright_black"
+    rich_utils.STYLE_COMMANDS_PANEL_BORDER = "bright_black"
+
+
+class _HelpStyleHook(importlib.abc.MetaPathFinder):
+    """Apply _override_help_styles as soon as Typer imports typer.rich_utils."""
+
+    def find_spec(self, name, path, target=None):
+        if name != "typer.rich_utils":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        exec_module = spec.loader.exec_module
+
+        def exec_and_style(module):
+            exec_module(module)
+            _override_help_styles(module)
+
+        spec.loader.exec_module = exec_and_style
+        return spec
+
+
+# typer.rich_utils (and the Rich markdown/syntax stack behind it) costs ~90ms to
+# import and Typer loads it lazily for help and error panels, so style it on load.
+if "typer.rich_utils" in sys.modules:
+    _override_help_styles(sys.modules["typer.rich_utils"])
+else:
+    sys.meta_path.insert(0, _HelpStyleHook())
 
 app = typer.Typer(help="Revis - Autonomous ML iteration engine")
 console = Console()
 
 TMUX_SESSION_PREFIX = "revis-"
+SESSION_NAME_RE = re.compile(r"\A[A-Za-z0-9][A-Za-z0-9_-]*\Z")
+
+# Rich styles for table cells, with the markup prebuilt per value
+SESSION_STATUS_STYLE = {
+    "running": "green",
+    "completed": "blue",
+    "stopped": "yellow",
+    "failed": "red",
+}
+RUN_STATUS_STYLE = {"completed": "green", "failed": "red", "running": "yellow"}
+OUTCOME_STYLE = {"improved": "green", "regressed": "red", "plateau": "yellow", "failed": "red"}
+_SESSION_STATUS_CELL = {k: f"[{v}]{k}[/{v}]" for k, v in SESSION_STATUS_STYLE.items()}
+_RUN_STATUS_CELL = {k: f"[{v}]{k}[/{v}]" for k, v in RUN_STATUS_STYLE.items()}
+_OUTCOME_CELL = {k: f"[{v}]{k}[/{v}]" for k, v in OUTCOME_STYLE.items()}
+
+
+def _styled_cell(value: str, cells: dict[str, str]) -> str:
+    """Markup for a table cell, falling back to white for unknown values."""
+    return cells.get(value) or f"[white]{value}[/white]"
 
 
 def get_tmux_session_name(name: str) -> str:
@@ -37,29 +92,140 @@ def get_tmux_session_name(name: str) -> str:
     return f"{TMUX_SESSION_PREFIX}{name}"
 
 
+TMUX_SESSION_TTL = 2.0
+
+# tmux session name -> (checked_at, exists)
+_tmux_session_cache: dict[str, tuple[float, bool]] = {}
+
+
+@functools.cache
+def tmux_path() -> str | None:
+    """Path to the tmux binary, looked up once per process."""
+    return shutil.which("tmux")
+
+
 def tmux_session_exists(session_name: str) -> bool:
-    """Check if a tmux session exists."""
+    """Check if a tmux session exists.
+
+    Results are cached for TMUX_SESSION_TTL seconds to avoid forking tmux on every check.
+    """
+    now = time.monotonic()
+    cached = _tmux_session_cache.get(session_name)
+    if cached is not None and now - cached[0] < TMUX_SESSION_TTL:
+        return cached[1]
+
+    exists = (
+        subprocess.call(
+            ["tmux", "has-session", "-t", session_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        == 0
+    )
+    _tmux_session_cache[session_name] = (now, exists)
+    return exists
+
+
+def tmux_pane_pidfd(session_name: str) -> int | None:
+    """Open a pidfd for a tmux session's pane process, so its exit can be select()ed.
+
+    Returns None where pidfds are unavailable (non-Linux) or the pane can't be resolved.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return None
     result = subprocess.run(
-        ["tmux", "has-session", "-t", session_name],
+        ["tmux", "display-message", "-p", "-t", session_name, "#{pane_pid}"],
         capture_output=True,
+        text=True,
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return None
+    try:
+        return os.pidfd_open(int(result.stdout.strip()))
+    except (OSError, ValueError):
+        return None
+
+
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps exc_info so RichHandler can still render tracebacks.
+
+    The listener runs in this process, so records don't need to be pickle-safe.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a 64KB buffer instead of flushing per record.
+
+    The buffer is flushed on ERROR records, on close, and every flush_interval
+    seconds so `revis logs -f` stays close to real time.
+    """
+
+    def __init__(self, filename: Path, flush_interval: float = 1.0):
+        super().__init__(filename)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, args=(flush_interval,), daemon=True
+        )
+        self._flusher.start()
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536, encoding=self.encoding)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        if record.levelno >= logging.ERROR:
+            self.flush()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
 
 
 def setup_logging(verbose: bool = False, session_name: str | None = None):
     """Configure logging with rich handler and optional file output.
 
     If session_name is provided, also logs to .revis/logs/<session_name>.log
+
+    Records are enqueued on the calling thread and rendered/written by a
+    background QueueListener, so logging never blocks the loop on terminal or disk I/O.
     """
+    global _log_listener
+
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
-    handlers: list[logging.Handler] = [RichHandler(console=console, rich_tracebacks=True)]
+    rich_handler = RichHandler(console=console, rich_tracebacks=True)
+    rich_handler.setLevel(level)
+    rich_handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    handlers: list[logging.Handler] = [rich_handler]
 
     # Add file handler for session logs
     if session_name:
         log_dir = Path(".revis/logs")
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / f"{session_name}.log"
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _BufferedFileHandler(log_file)
         file_handler.setLevel(logging.DEBUG)  # Always capture debug in file
         file_handler.setFormatter(
             logging.Formatter(
@@ -68,34 +234,70 @@ def setup_logging(verbose: bool = False, session_name: str | None = None):
         )
         handlers.append(file_handler)
 
+    _stop_log_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+
     logging.basicConfig(
         level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=handlers,
+        handlers=[_InProcessQueueHandler(log_queue)],
         force=True,  # Override any existing config
     )
     logging.getLogger("paramiko").setLevel(logging.WARNING)
     logging.getLogger("litellm").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_log_listener() -> None:
+    """Drain queued records and flush buffered handlers."""
+    global _log_listener
+
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
 REVIS_DIR = ".revis"
 CONFIG_FILE = "revis.yaml"
 DB_FILE = f"{REVIS_DIR}/revis.db"
 
 
-def get_store() -> SQLiteRunStore:
-    """Get the run store, initializing if needed."""
+def _write_atomic(path: Path, content: str) -> None:
+    """Write a file via a temp file and rename, so a crash never leaves it half-written."""
+    tmp = path.with_name(f"{path.name}.tmp")
+    with open(tmp, "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+@functools.cache
+def get_store() -> "SQLiteRunStore":
+    """Get the run store, initializing if needed.
+
+    The store (and its connection) is shared for the life of the process.
+    """
+    from revis.store.sqlite import SQLiteRunStore
+
     db_path = Path(DB_FILE)
     if not db_path.exists():
         console.print("[red]Error:[/red] Revis not initialized. Run 'revis init' first.")
         raise typer.Exit(1)
-    return SQLiteRunStore(db_path)
+    store = SQLiteRunStore(db_path)
+    atexit.register(store.close)
+    return store
 
 
 @app.command()
 def init():
     """Initialize Revis in the current directory with interactive setup."""
+    from revis.store.sqlite import SQLiteRunStore
+
     revis_dir = Path(REVIS_DIR)
     config_file = Path(CONFIG_FILE)
 
@@ -116,11 +318,11 @@ def init():
 
     # Run interactive setup
     try:
-        from revis.config import generate_config_yaml
+        from revis.config import generate_config_yaml, get_config_template_bytes
         from revis.init.prompts import run_interactive_init
 
         init_config = run_interactive_init()
-        config_content = generate_config_yaml(
+        config_bytes = generate_config_yaml(
             train_command=init_config.train_command,
             metrics_source=init_config.metrics_source,
             metrics_project=init_config.metrics_project,
@@ -134,28 +336,27 @@ def init():
             ssh_key_path=init_config.ssh_key_path,
             coding_agent_type=init_config.coding_agent_type,
             extra_deny_patterns=init_config.extra_deny_patterns,
-        )
+        ).encode("utf-8")
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled.[/yellow]")
         raise typer.Exit(0)
     except ImportError as e:
         console.print(f"[yellow]Warning:[/yellow] Interactive setup unavailable: {e}")
         console.print("Using default template instead.")
-        config_content = get_config_template()
+        config_bytes = get_config_template_bytes()
 
     # Write config
-    config_file.write_text(config_content)
+    config_file.write_bytes(config_bytes)
 
     # Add .revis to .gitignore if it exists
     gitignore = Path(".gitignore")
-    if gitignore.exists():
+    if os.path.exists(gitignore):
         content = gitignore.read_text()
         if REVIS_DIR not in content:
-            with open(gitignore, "a") as f:
-                f.write(f"\n# Revis\n{REVIS_DIR}/\n")
+            _write_atomic(gitignore, f"{content}\n# Revis\n{REVIS_DIR}/\n")
             console.print(f"Added {REVIS_DIR}/ to .gitignore")
     else:
-        gitignore.write_text(f"# Revis\n{REVIS_DIR}/\n")
+        _write_atomic(gitignore, f"# Revis\n{REVIS_DIR}/\n")
         console.print(f"Created .gitignore with {REVIS_DIR}/")
 
     console.print("\n[green]Revis initialized![/green]")
@@ -165,20 +366,22 @@ def init():
 
 @app.command()
 def status(
-    watch: bool = typer.Option(False, "--watch", "-w", help="Refresh every 5 seconds"),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Refresh when the session changes"),
 ):
     """Show current session status."""
+    from rich.table import Table
+
     store = get_store()
 
     def show_status():
-        session = store.get_running_session()
+        snapshot = store.get_status_snapshot(limit=5)
+        session = snapshot.running
 
         if session is None:
             # Check for orphaned sessions
-            orphaned = store.get_orphaned_sessions()
-            if orphaned:
+            if snapshot.orphaned:
                 console.print("[yellow]Warning:[/yellow] Found orphaned session(s):")
-                for s in orphaned:
+                for s in snapshot.orphaned:
                     console.print(f"  - {s.name} (branch: {s.branch})")
                 console.print("\nUse 'revis stop' to clean up.")
             else:
@@ -205,7 +408,7 @@ def status(
         console.print(f"[bold]LLM cost:[/bold] ${session.llm_cost_usd:.2f}")
 
         # Recent runs
-        runs = store.query_runs(session_id=session.id, limit=5)
+        runs = snapshot.recent_runs
         if runs:
             console.print("\n[bold]Recent runs:[/bold]")
             table = Table()
@@ -215,9 +418,8 @@ def status(
 
             for run in reversed(runs):
                 duration = ""
-                if run.started_at and run.ended_at:
-                    secs = (run.ended_at - run.started_at).total_seconds()
-                    duration = format_duration(int(secs))
+                if run.duration_s is not None:
+                    duration = format_duration(run.duration_s)
                 elif run.started_at:
                     duration = "running..."
 
@@ -229,11 +431,16 @@ def status(
             console.print(table)
 
     if watch:
+        # Only re-render when another connection (the loop) has committed changes
+        last_version = None
         try:
             while True:
-                console.clear()
-                show_status()
-                time.sleep(5)
+                version = store.data_version()
+                if version != last_version:
+                    last_version = version
+                    console.clear()
+                    show_status()
+                time.sleep(1)
         except KeyboardInterrupt:
             pass
     else:
@@ -253,9 +460,12 @@ def loop(
     ),
 ):
     """Start the autonomous iteration loop."""
+    from revis.config import load_config, parse_duration
+    from revis.types import Budget
+
     # Handle background mode - launch in tmux and exit
     if background and not _in_tmux:
-        if not shutil.which("tmux"):
+        if not tmux_path():
             console.print(
                 "[red]Error:[/red] tmux not installed. Install it or run without --background."
             )
@@ -285,7 +495,7 @@ def loop(
             cmd_parts.append("--verbose")
 
         # Escape for shell
-        cmd = " ".join(cmd_parts)
+        cmd = shlex.join(cmd_parts)
         cwd = os.getcwd()
 
         # Launch in tmux
@@ -293,6 +503,7 @@ def loop(
             ["tmux", "new-session", "-d", "-s", tmux_name, "-c", cwd, cmd],
             check=True,
         )
+        _tmux_session_cache.pop(tmux_name, None)
 
         console.print("[green]Revis loop started in background[/green]")
         console.print(f"  Session: {name}")
@@ -309,9 +520,10 @@ def loop(
     store = get_store()
 
     # Validate name
-    if not name.replace("-", "").replace("_", "").isalnum():
+    if not SESSION_NAME_RE.match(name):
         console.print(
-            "[red]Error:[/red] Session name must be alphanumeric (dashes/underscores allowed)"
+            "[red]Error:[/red] Session name must be alphanumeric (dashes/underscores allowed, "
+            "not as the first character)"
         )
         raise typer.Exit(1)
 
@@ -368,6 +580,8 @@ def resume(
     _in_tmux: bool = typer.Option(False, "--_in-tmux", hidden=True),
 ):
     """Resume a stopped session."""
+    from revis.config import load_config
+
     store = get_store()
 
     # Handle background mode first (before any other checks)
@@ -385,9 +599,10 @@ def resume(
 
         cwd = str(Path.cwd())
         tmux_name = f"revis-{name}"
-        cmd = f"revis resume {name} --_in-tmux"
+        cmd_parts = ["revis", "resume", name, "--_in-tmux"]
         if verbose:
-            cmd += " -v"
+            cmd_parts.append("-v")
+        cmd = shlex.join(cmd_parts)
 
         subprocess.run(
             ["tmux", "new-session", "-d", "-s", tmux_name, "-c", cwd, cmd],
@@ -459,7 +674,7 @@ def watch(
     name: str = typer.Argument(..., help="Session name to watch"),
 ):
     """Attach to a running loop's tmux session."""
-    if not shutil.which("tmux"):
+    if not tmux_path():
         console.print("[red]Error:[/red] tmux not installed.")
         raise typer.Exit(1)
 
@@ -483,7 +698,7 @@ def logs(
     """Show recent output from a session (from log file or tmux)."""
     log_file = Path(f".revis/logs/{name}.log")
     tmux_name = get_tmux_session_name(name)
-    tmux_running = shutil.which("tmux") and tmux_session_exists(tmux_name)
+    tmux_running = tmux_path() and tmux_session_exists(tmux_name)
 
     # Prefer log file (persists after session ends)
     if log_file.exists():
@@ -495,19 +710,21 @@ def logs(
                 pass
         else:
             # Show last N lines
-            content = log_file.read_text()
-            log_lines = content.strip().split("\n")
-            for line in log_lines[-lines:]:
-                console.print(line)
+            log_lines = tail_lines(log_file, lines)
+            # Log lines are already formatted; bypass Rich markup parsing
+            if log_lines:
+                sys.stdout.buffer.write("\n".join(log_lines).encode() + b"\n")
+                sys.stdout.buffer.flush()
             if tmux_running:
                 console.print(f"\n[dim]Attach: revis watch {name}[/dim]")
             else:
-                shown = min(lines, len(log_lines))
-                console.print(f"\n[dim]Session finished. Showing last {shown} lines.[/dim]")
+                console.print(
+                    f"\n[dim]Session finished. Showing last {len(log_lines)} lines.[/dim]"
+                )
         return
 
     # Fall back to tmux if log file doesn't exist
-    if not shutil.which("tmux"):
+    if not tmux_path():
         console.print(f"[red]Error:[/red] No log file found at {log_file}")
         raise typer.Exit(1)
 
@@ -518,20 +735,37 @@ def logs(
         console.print("The session may not have started, or logs were not captured.")
         raise typer.Exit(1)
 
-    if follow:
+    if follow and sys.stdout.isatty():
+        # Read-only attach streams the pane natively (replaces current process)
+        os.execvp("tmux", ["tmux", "attach-session", "-r", "-t", tmux_name])
+    elif follow:
+        # No terminal to attach to: dump the pane every second until the session exits.
+        # The pane's pidfd is opened once and doubles as the one-second sleep.
+        import select
+
+        pidfd = tmux_pane_pidfd(tmux_name)
         try:
             while True:
-                os.system("clear")
                 result = subprocess.run(
                     ["tmux", "capture-pane", "-t", tmux_name, "-p", "-S", f"-{lines}"],
                     capture_output=True,
                     text=True,
                 )
-                print(result.stdout)
-                print(f"\n[Following {tmux_name} - Ctrl+C to stop]")
-                time.sleep(1)
+                print(result.stdout, flush=True)
+                if pidfd is not None:
+                    if select.select([pidfd], [], [], 1)[0]:
+                        break
+                else:
+                    time.sleep(1)
+                    # Skip the TTL cache so the exit shows up on this tick
+                    _tmux_session_cache.pop(tmux_name, None)
+                    if not tmux_session_exists(tmux_name):
+                        break
         except KeyboardInterrupt:
             pass
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
     else:
         result = subprocess.run(
             ["tmux", "capture-pane", "-t", tmux_name, "-p", "-S", f"-{lines}"],
@@ -552,6 +786,8 @@ def list_sessions(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show additional details"),
 ):
     """List all Revis sessions."""
+    from rich.table import Table
+
     store = get_store()
 
     sessions = store.list_sessions(limit=100)
@@ -572,13 +808,6 @@ def list_sessions(
         table.add_column("Started")
 
     for session in sessions:
-        status_style = {
-            "running": "green",
-            "completed": "blue",
-            "stopped": "yellow",
-            "failed": "red",
-        }.get(session.status, "white")
-
         # Budget display
         if session.budget.type == "time":
             budget_str = (
@@ -591,7 +820,7 @@ def list_sessions(
 
         row = [
             session.name,
-            f"[{status_style}]{session.status}[/{status_style}]",
+            _styled_cell(session.status, _SESSION_STATUS_CELL),
             str(session.iteration_count),
             budget_str,
             exported,
@@ -616,6 +845,8 @@ def show(
     trace: bool = typer.Option(False, "--trace", "-t", help="Show agent tool call traces"),
 ):
     """Show detailed information about a session."""
+    from revis.config import load_config
+
     store = get_store()
 
     session = store.get_session_by_name(name)
@@ -654,8 +885,8 @@ def show(
     console.print(f"  LLM Cost: ${session.llm_cost_usd:.2f}")
     console.print(f"  Retries Remaining: {session.retry_budget}")
 
-    runs = store.query_runs(session_id=session.id, limit=50)
-    if not runs:
+    full_runs = store.query_runs_full(session.id, limit=50, ascending=True)
+    if not full_runs:
         return
 
     # Load config for primary metric name
@@ -664,15 +895,30 @@ def show(
     primary_metric = config.metrics.primary if config else "loss"
 
     if trace:
-        _show_traces(store, runs)
+        _show_traces(store, full_runs)
     else:
-        _show_runs_table(store, runs, session.iteration_count, primary_metric)
+        _show_runs_table(full_runs, session.iteration_count, primary_metric)
 
 
-def _show_runs_table(store, runs: list, iteration_count: int, primary_metric: str) -> None:
-    """Show runs as a summary table."""
+def _run_metrics(run, metrics: list) -> dict[str, float]:
+    """Get a run's metrics: logged metrics, overlaid by the stored metrics_json snapshot."""
     import json
 
+    merged = {m.name: m.value for m in metrics}
+    if run.metrics_json:
+        try:
+            snapshot = json.loads(run.metrics_json)
+        except json.JSONDecodeError:
+            snapshot = {}
+        if isinstance(snapshot, dict):
+            merged.update(snapshot)
+    return merged
+
+
+def _show_runs_table(full_runs: list, iteration_count: int, primary_metric: str) -> None:
+    """Show runs (as returned by query_runs_full, oldest first) as a summary table."""
+    from rich.table import Table
+
     console.print(f"\n[bold]Iterations ({iteration_count}):[/bold]")
 
     table = Table()
@@ -684,7 +930,7 @@ def _show_runs_table(store, runs: list, iteration_count: int, primary_metric: st
     table.add_column("Outcome")
     table.add_column("Duration")
 
-    for run in reversed(runs):
+    for run, metrics, _ in full_runs:
         # Change column: actual config changes from change_description
         change_str = run.change_description or "initial"
         if run.change_type == "code_handoff":
@@ -698,106 +944,88 @@ def _show_runs_table(store, runs: list, iteration_count: int, primary_metric: st
             hypothesis = hypothesis[:32] + "..."
 
         # Primary metric value
-        metric_value = "-"
-        if run.metrics_json:
-            try:
-                metrics = json.loads(run.metrics_json)
-                if primary_metric in metrics:
-                    metric_value = f"{metrics[primary_metric]:.4f}"
-            except json.JSONDecodeError:
-                pass
-        if metric_value == "-":
-            db_metrics = store.get_run_metrics(run.id)
-            for m in db_metrics:
-                if m.name == primary_metric:
-                    metric_value = f"{m.value:.4f}"
-                    break
+        value = _run_metrics(run, metrics).get(primary_metric)
+        metric_value = f"{value:.4f}" if value is not None else "-"
 
         # Outcome with styling
         outcome = run.outcome or "-"
-        outcome_style = {
-            "improved": "green",
-            "regressed": "red",
-            "plateau": "yellow",
-            "failed": "red",
-        }.get(outcome, "white")
 
         # Duration - fix bug by checking status instead of just started_at
         duration_str = ""
-        if run.started_at and run.ended_at:
-            secs = (run.ended_at - run.started_at).total_seconds()
-            duration_str = format_duration(int(secs))
+        if run.duration_s is not None:
+            duration_str = format_duration(run.duration_s)
         elif run.status == "running":
             duration_str = "running..."
 
-        status_style = {"completed": "green", "failed": "red", "running": "yellow"}.get(
-            run.status, "white"
-        )
-
         table.add_row(
             str(run.iteration_number),
-            f"[{status_style}]{run.status}[/{status_style}]",
+            _styled_cell(run.status, _RUN_STATUS_CELL),
             change_str,
             hypothesis,
             metric_value,
-            f"[{outcome_style}]{outcome}[/{outcome_style}]",
+            _styled_cell(outcome, _OUTCOME_CELL),
             duration_str,
         )
 
     console.print(table)
 
 
-def _show_traces(store, runs: list) -> None:
-    """Show agent tool call traces for each run."""
-    for run in reversed(runs):
-        console.print(f"\n[bold]─── Iteration {run.iteration_number} ───[/bold]")
+def _show_traces(store, full_runs: list) -> None:
+    """Show agent tool call traces for each run (as returned by query_runs_full, oldest first)."""
+    from rich.text import Text
 
-        traces = store.get_traces(run.id)
-        if not traces:
-            console.print("  [dim]No traces recorded[/dim]")
-            continue
+    # Only tool calls are shown; tool results are interleaved and make output noisy
+    traces_by_run = store.get_traces_bulk([run.id for run, _, _ in full_runs], "tool_call")
 
+    for run, _, rationale in full_runs:
+        lines = [Text(f"\n─── Iteration {run.iteration_number} ───", style="bold")]
+
+        traces = traces_by_run[run.id]
+        if not traces:
+            lines.append(Text("  No traces recorded", style="dim"))
         for trace in traces:
-            event_type = trace["event_type"]
             data = trace["data"]
+            tool = data.get("tool", "?")
+            lines.append(
+                Text.assemble(
+                    ("→", "dim"),
+                    " ",
+                    (tool, "cyan"),
+                    *_format_trace_args(tool, data.get("args", {})),
+                )
+            )
 
-            if event_type == "tool_call":
-                tool = data.get("tool", "?")
-                args = data.get("args", {})
-                console.print(f"[dim]→[/dim] [cyan]{tool}[/cyan]", end="")
-                _print_trace_args(tool, args)
-            # Skip tool_result - they're interleaved and make output noisy
+        if traces and rationale:
+            lines.append(Text.assemble(("Rationale:", "green"), f" {rationale}"))
 
-        decisions = store.get_decisions(run.id)
-        if decisions:
-            rationale = decisions[0].rationale
-            console.print(f"[green]Rationale:[/green] {rationale}")
+        console.print(Text("\n").join(lines))
 
 
-def _print_trace_args(tool: str, args: dict) -> None:
-    """Format tool arguments for trace display."""
+def _format_trace_args(tool: str, args: dict) -> list[str | tuple[str, str]]:
+    """Format tool arguments for trace display as Text.assemble parts."""
     if tool == "read_file":
-        console.print(f"([yellow]{args.get('path', '?')}[/yellow])")
+        return ["(", (str(args.get("path", "?")), "yellow"), ")"]
     elif tool == "write_file":
-        path = args.get("path", "?")
+        path = str(args.get("path", "?"))
         content = args.get("content", "")
-        console.print(f"([yellow]{path}[/yellow]) [dim]{len(content)} bytes[/dim]")
+        return ["(", (path, "yellow"), ") ", (f"{len(content)} bytes", "dim")]
     elif tool == "search_codebase":
-        console.print(f"([yellow]{args.get('pattern', '?')}[/yellow])")
+        return ["(", (str(args.get("pattern", "?")), "yellow"), ")"]
     elif tool == "find_definition":
-        console.print(f"([yellow]{args.get('name', '?')}[/yellow])")
+        return ["(", (str(args.get("name", "?")), "yellow"), ")"]
     elif tool == "list_directory":
-        path = args.get("path", ".")
-        recursive = args.get("recursive", False)
-        suffix = " [dim]recursive[/dim]" if recursive else ""
-        console.print(f"([yellow]{path}[/yellow]){suffix}")
+        path = str(args.get("path", "."))
+        parts: list[str | tuple[str, str]] = ["(", (path, "yellow"), ")"]
+        if args.get("recursive", False):
+            parts += [" ", ("recursive", "dim")]
+        return parts
     elif tool == "run_command":
-        cmd = args.get("command", "?")
+        cmd = str(args.get("command", "?"))
         if len(cmd) > 50:
             cmd = cmd[:47] + "..."
-        console.print(f"([yellow]{cmd}[/yellow])")
+        return ["(", (cmd, "yellow"), ")"]
     else:
-        console.print(f"({args})")
+        return [f"({args})"]
 
 
 @app.command()
@@ -807,6 +1035,8 @@ def pr(
     force: bool = typer.Option(False, "--force", "-f", help="Force push (use with caution)"),
 ):
     """Push session branch to remote and create a GitHub PR."""
+    from revis.config import load_config
+
     store = get_store()
 
     session = store.get_session_by_name(name)
@@ -866,17 +1096,15 @@ def pr(
         else:
             console.print("Creating pull request...")
 
-            runs = store.query_runs(session_id=session.id, limit=100)
-            runs = list(reversed(runs))
+            runs = store.query_runs(session_id=session.id, limit=100, ascending=True)
 
-            run_metrics = {}
-            decisions = {}
-            for run in runs:
-                metrics = store.get_run_metrics(run.id)
-                run_metrics[run.id] = {m.name: m.value for m in metrics}
-                run_decisions = store.get_decisions(run.id)
-                if run_decisions:
-                    decisions[run.id] = run_decisions[0].rationale
+            run_ids = [run.id for run in runs]
+            run_metrics = store.get_run_metrics_maps(run_ids)
+            decisions = {
+                run_id: run_decisions[0].rationale
+                for run_id, run_decisions in store.get_decisions_bulk(run_ids).items()
+                if run_decisions
+            }
 
             analyzer = RunAnalyzer(
                 store=store,
@@ -963,9 +1191,9 @@ def delete(
     git = GitManager(GitConfig(repo_path=repo_path))
     current_branch = git.get_current_branch()
 
-    for session in sessions_to_delete:
-        # Delete git branch if requested
-        if not keep_branch:
+    # Delete git branches if requested
+    if not keep_branch:
+        for session in sessions_to_delete:
             if current_branch == session.branch:
                 console.print(f"[yellow]Warning:[/yellow] Branch '{session.branch}' is checked out")
             elif git.branch_exists(session.branch):
@@ -975,21 +1203,42 @@ def delete(
                 except Exception as e:
                     console.print(f"  [yellow]Warning:[/yellow] Could not delete branch: {e}")
 
-        # Delete from database
-        store.delete_session(session.id, force=force)
+    # Delete from database in a single transaction
+    with store.write_txn():
+        for session in sessions_to_delete:
+            store.delete_session(session.id, force=force)
+    for session in sessions_to_delete:
         console.print(f"[green]Deleted session:[/green] {session.name}")
 
 
+def tail_lines(path: Path, n: int, block_size: int = 8192) -> list[str]:
+    """Return the last n lines of a file, reading backwards from the end in blocks."""
+    if n <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = bytearray()
+        # n lines need n+1 newlines unless we reach the start of the file
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data[:0] = f.read(step)
+
+    return data.decode(errors="replace").strip().splitlines()[-n:]
+
+
+@functools.lru_cache(maxsize=256)
 def format_duration(seconds: int) -> str:
     """Format seconds as human-readable duration."""
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{seconds // 60}m {seconds % 60}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
         return f"{hours}h {minutes}m"
+    return f"{minutes}m {secs}s"
 
 
 @app.command()
@@ -1001,6 +1250,8 @@ def compare(
     """Compare two iterations from a session."""
     import json
 
+    from rich.table import Table
+
     store = get_store()
 
     session = store.get_session_by_name(name)
@@ -1025,8 +1276,7 @@ def compare(
                 return json.loads(run.metrics_json)
             except json.JSONDecodeError:
                 pass
-        db_metrics = store.get_run_metrics(run.id)
-        return {m.name: m.value for m in db_metrics}
+        return store.get_run_metrics_map(run.id)
 
     metrics1 = get_metrics(run1)
     metrics2 = get_metrics(run2)
@@ -1091,8 +1341,7 @@ def export_data(
         export_dir.mkdir(parents=True, exist_ok=True)
         output_path = export_dir / f"{name}.{format}"
 
-    runs = store.query_runs(session_id=session.id, limit=1000)
-    runs = list(reversed(runs))
+    full_runs = store.query_runs_full(session.id, limit=1000, ascending=True)
 
     if format == "json":
         data = {
@@ -1107,16 +1356,8 @@ def export_data(
             "iterations": [],
         }
 
-        for run in runs:
-            metrics = {}
-            if run.metrics_json:
-                try:
-                    metrics = json.loads(run.metrics_json)
-                except json.JSONDecodeError:
-                    pass
-            if not metrics:
-                db_metrics = store.get_run_metrics(run.id)
-                metrics = {m.name: m.value for m in db_metrics}
+        for run, run_metrics, _ in full_runs:
+            metrics = _run_metrics(run, run_metrics)
 
             data["iterations"].append(
                 {
@@ -1140,23 +1381,13 @@ def export_data(
             print(content)
 
     elif format == "csv":
-        if not runs:
+        if not full_runs:
             console.print("No iterations to export.")
             return
 
+        run_metrics_cache = {run.id: _run_metrics(run, metrics) for run, metrics, _ in full_runs}
         all_metric_names: set[str] = set()
-        run_metrics_cache = {}
-        for run in runs:
-            metrics = {}
-            if run.metrics_json:
-                try:
-                    metrics = json.loads(run.metrics_json)
-                except json.JSONDecodeError:
-                    pass
-            if not metrics:
-                db_metrics = store.get_run_metrics(run.id)
-                metrics = {m.name: m.value for m in db_metrics}
-            run_metrics_cache[run.id] = metrics
+        for metrics in run_metrics_cache.values():
             all_metric_names.update(metrics.keys())
 
         fieldnames = [
@@ -1171,7 +1402,7 @@ def export_data(
         writer = csv.DictWriter(output, fieldnames=fieldnames)
         writer.writeheader()
 
-        for run in runs:
+        for run, _, _ in full_runs:
             row = {
                 "iteration": run.iteration_number,
                 "change_type": run.change_type or "",
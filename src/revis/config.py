@@ -1,10 +1,21 @@
 """Configuration models for Revis."""
 
+import os
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, TypeAdapter, field_validator
+
+from revis import __version__
+
+# Use libyaml's C loader when PyYAML was built with it; it parses several times faster
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+CONFIG_CACHE_FILE = ".revis/config.cache.json"
 
 
 class ExecutorConfig(BaseModel):
@@ -60,6 +71,13 @@ class CodingAgentConfig(BaseModel):
     type: Literal["auto", "claude-code", "none"] = "auto"
     auto_handoff: bool = True  # false = pause and ask before handing off
     verify: bool = True  # run smoke test after changes
+    timeout: str = "10m"  # Max wall-clock time per handoff
+
+    @field_validator("timeout")
+    @classmethod
+    def validate_timeout(cls, v: str) -> str:
+        parse_duration(v)
+        return v
 
 
 class GuardrailsConfig(BaseModel):
@@ -135,16 +153,26 @@ class RevisConfig(BaseModel):
     coding_agent: CodingAgentConfig = CodingAgentConfig()
 
 
+# Built once at import; load_config validates through pydantic-core directly
+_REVIS_CONFIG_ADAPTER = TypeAdapter(RevisConfig)
+
+
+# Seconds per duration unit, indexed by the unit's ASCII code (0 = invalid unit)
+_DURATION_MULTIPLIERS = tuple(
+    {"s": 1, "m": 60, "h": 3600, "d": 86400}.get(chr(code), 0) for code in range(128)
+)
+
+
 def parse_duration(duration_str: str) -> int:
     """Parse duration string to seconds. Supports: 30s, 5m, 2h, 1d."""
     duration_str = duration_str.strip().lower()
     if not duration_str:
         raise ValueError("Empty duration string")
 
-    multipliers = {"s": 1, "m": 60, "h": 3600, "d": 86400}
     unit = duration_str[-1]
-
-    if unit not in multipliers:
+    code = ord(unit)
+    multiplier = _DURATION_MULTIPLIERS[code] if code < 128 else 0
+    if not multiplier:
         raise ValueError(f"Invalid duration unit: {unit}. Use s, m, h, or d.")
 
     try:
@@ -152,19 +180,48 @@ def parse_duration(duration_str: str) -> int:
     except ValueError:
         raise ValueError(f"Invalid duration value: {duration_str[:-1]}")
 
-    return value * multipliers[unit]
+    return value * multiplier
 
 
 def load_config(path: Path) -> RevisConfig:
     """Load configuration from YAML file."""
+    return load_config_cached(path)
+
+
+def load_config_cached(path: Path) -> RevisConfig:
+    """Load configuration, reusing the validated config cached as JSON in .revis/ when unchanged.
+
+    The cache is keyed on the file's resolved path, mtime and size (and the Revis
+    version), so any edit to revis.yaml falls through to a full YAML parse and validation.
+    The cache is plain JSON re-validated on load, so it can't execute code.
+    """
+    st = path.stat()
+    key = f"{__version__}:{path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    cache_path = path.parent / CONFIG_CACHE_FILE
+
+    try:
+        cached_key, _, body = cache_path.read_text().partition("\n")
+        if cached_key == key:
+            return _REVIS_CONFIG_ADAPTER.validate_json(body)
+    except Exception:
+        pass  # Missing, corrupt or stale cache
+
     with open(path) as f:
-        data = yaml.safe_load(f)
-    return RevisConfig(**data)
+        data = yaml.load(f, Loader=_SafeLoader)
+    config = _REVIS_CONFIG_ADAPTER.validate_python(data)
 
+    # Only cache inside an initialized project
+    if cache_path.parent.is_dir():
+        tmp = cache_path.with_name(f"{cache_path.name}.tmp")
+        try:
+            tmp.write_text(f"{key}\n{config.model_dump_json()}")
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+    return config
 
-def get_config_template() -> str:
-    """Get the default configuration template."""
-    return """# Revis Configuration
+
+CONFIG_TEMPLATE = """# Revis Configuration
 # Generated by 'revis init'. Edit as needed.
 
 executor:
@@ -234,6 +291,7 @@ coding_agent:
   type: auto  # auto, claude-code, or none
   auto_handoff: true  # false = ask before code changes
   verify: true  # Run smoke test after changes
+  timeout: 10m  # Max time per handoff (s/m/h/d)
 
 artifacts:
   path: .revis/artifacts
@@ -245,6 +303,19 @@ github:
 """
 
 
+CONFIG_TEMPLATE_BYTES = CONFIG_TEMPLATE.encode("utf-8")
+
+
+def get_config_template() -> str:
+    """Get the default configuration template."""
+    return CONFIG_TEMPLATE
+
+
+def get_config_template_bytes() -> bytes:
+    """Get the default configuration template, UTF-8 encoded for writing."""
+    return CONFIG_TEMPLATE_BYTES
+
+
 def generate_config_yaml(
     train_command: str,
     metrics_source: str,
@@ -351,6 +422,7 @@ def generate_config_yaml(
     lines.append(f"  type: {coding_agent_type}  # auto, claude-code, or none")
     lines.append("  auto_handoff: true  # false = ask before code changes")
     lines.append("  verify: true  # Run smoke test after changes")
+    lines.append("  timeout: 10m  # Max time per handoff (s/m/h/d)")
     lines.append("")
 
     # Artifacts
@@ -1,11 +1,18 @@
 """Evaluation harness for collecting and validating eval results."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from revis.executor.ssh import SSHExecutor
+from revis.metrics.eval_json import loads_json
 from revis.types import EvalResult
 
+_NUMERIC = (int, float)
+
+# Concurrent plot downloads; each worker gets its own SFTP channel
+MAX_PLOT_WORKERS = 8
+
 
 class EvalHarness:
     """Harness for running evaluation and collecting results."""
@@ -30,16 +37,16 @@ class EvalHarness:
 
     def collect(self, eval_path: str = "eval.json") -> EvalResult:
         """Collect eval.json from remote and parse it."""
-        if not self.executor.file_exists(eval_path):
+        content = self.executor.read_file_or_none(eval_path)
+        if content is None:
             raise FileNotFoundError(f"Evaluation output not found: {eval_path}")
 
-        content = self.executor.read_file(eval_path)
         return self.parse_eval_json(content)
 
     def parse_eval_json(self, content: str) -> EvalResult:
         """Parse eval.json content into EvalResult."""
         try:
-            data = json.loads(content)
+            data = loads_json(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid eval.json: {e}")
 
@@ -51,10 +58,12 @@ class EvalHarness:
         if not isinstance(metrics, dict):
             raise ValueError("eval.json 'metrics' must be a dictionary")
 
-        # Validate metric values are numeric
-        for name, value in metrics.items():
-            if not isinstance(value, (int, float)):
-                raise ValueError(f"Metric '{name}' must be numeric, got {type(value).__name__}")
+        # Validate metric values are numeric, reporting every offender at once
+        bad = [
+            f"'{k}' ({type(v).__name__})" for k, v in metrics.items() if not isinstance(v, _NUMERIC)
+        ]
+        if bad:
+            raise ValueError(f"Metrics must be numeric, got: {', '.join(bad)}")
 
         return EvalResult(
             metrics=metrics,
@@ -64,15 +73,21 @@ class EvalHarness:
 
     def collect_plots(self, plots: list[str], local_dest: Path) -> list[Path]:
         """Collect plot files from remote."""
-        collected = []
-        for plot in plots:
+        if not plots:
+            return []
+
+        def download(plot: str) -> Path | None:
             local_path = local_dest / plot
             try:
                 self.executor.download_file(plot, local_path)
-                collected.append(local_path)
+                return local_path
             except Exception as e:
                 print(f"Warning: Failed to collect plot {plot}: {e}")
-        return collected
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PLOT_WORKERS, len(plots))) as pool:
+            results = list(pool.map(download, plots))
+        return [path for path in results if path is not None]
 
 
 def validate_eval_schema(data: dict) -> list[str]:
@@ -84,9 +99,11 @@ def validate_eval_schema(data: dict) -> list[str]:
     elif not isinstance(data["metrics"], dict):
         errors.append("'metrics' must be a dictionary")
     else:
-        for name, value in data["metrics"].items():
-            if not isinstance(value, (int, float)):
-                errors.append(f"Metric '{name}' must be numeric")
+        errors.extend(
+            f"Metric '{name}' must be numeric"
+            for name, value in data["metrics"].items()
+            if not isinstance(value, _NUMERIC)
+        )
 
     if "slices" in data:
         if not isinstance(data["slices"], dict):
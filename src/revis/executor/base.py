@@ -14,6 +14,52 @@ class ExitResult:
     error_message: str | None = None
 
 
+# Longest a single wait blocks before re-checking the session and the timeout
+WAIT_SLICE_SECONDS = 30
+
+
+def done_channel(session_name: str) -> str:
+    """tmux wait-for channel signalled when a launched command finishes."""
+    return f"revis-done-{session_name}"
+
+
+def wrap_command(command: str, exit_file: str, session_name: str) -> str:
+    """Shell script run inside tmux: the command, then its exit code and a done signal.
+
+    The command runs in a subshell so an `exit` inside it still records a code.
+    """
+    return (
+        f'({command}); echo "EXIT_CODE=$?" >> {exit_file}; '
+        f"tmux wait-for -S {done_channel(session_name)}"
+    )
+
+
+def wait_done_command(session_name: str, seconds: int) -> str:
+    """Shell command that blocks until the session's command signals completion.
+
+    A background sleeper signals the same channel, so it returns after at most
+    `seconds`; it returns immediately if the session no longer exists.
+    """
+    channel = done_channel(session_name)
+    return (
+        f"tmux has-session -t {session_name} 2>/dev/null && {{ "
+        f"( sleep {seconds}; tmux wait-for -S {channel} ) >/dev/null 2>&1 & "
+        f"t=$!; tmux wait-for {channel}; kill $t 2>/dev/null; }}"
+    )
+
+
+def parse_exit_file(content: str) -> ExitResult | None:
+    """Build an ExitResult from .revis_exit content, or None if no code was written."""
+    if "EXIT_CODE=" not in content:
+        return None
+    code = int(content.split("EXIT_CODE=")[1].strip())
+    return ExitResult(
+        exit_code=code,
+        failed=code != 0,
+        error_message=None if code == 0 else f"Process exited with code {code}",
+    )
+
+
 class Executor(Protocol):
     """Protocol for remote command execution."""
 
@@ -66,6 +112,10 @@ class Executor(Protocol):
         """Read file content."""
         ...
 
+    def read_file_or_none(self, path: str) -> str | None:
+        """Read file content, or return None if the file does not exist."""
+        ...
+
     def close(self) -> None:
         """Close executor and cleanup resources."""
         ...
@@ -1,12 +1,47 @@
 """Local executor for running training on the same machine."""
 
+import glob
+import math
+import os
+import shutil
+import stat
 import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
-from revis.executor.base import ExitResult
+from revis.executor.base import (
+    WAIT_SLICE_SECONDS,
+    ExitResult,
+    done_channel,
+    parse_exit_file,
+    wait_done_command,
+    wrap_command,
+)
+
+
+def _read_tail(path: Path, n: int, block_size: int = 65536) -> bytes:
+    """Return the last n lines of a file like `tail -n`, reading backwards in blocks."""
+    if n <= 0:
+        return b""
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = bytearray()
+        # A trailing newline ends the last line, so n lines need n+1 newlines
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data[:0] = f.read(step)
+
+    start = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(n):
+        start = data.rfind(b"\n", 0, start)
+        if start < 0:
+            return bytes(data)
+    return bytes(data[start + 1 :])
 
 
 @dataclass
@@ -22,6 +57,7 @@ class LocalExecutor:
     def __init__(self, config: LocalConfig):
         self.config = config
         self._work_dir = Path(config.work_dir).expanduser().resolve()
+        self._work_dir_str = str(self._work_dir)
 
     def _run(self, command: str, timeout: int | None = None) -> tuple[int, str, str]:
         """Run a shell command locally."""
@@ -35,6 +71,11 @@ class LocalExecutor:
         )
         return result.returncode, result.stdout, result.stderr
 
+    def _run_argv(self, *argv: str) -> tuple[int, str, str]:
+        """Run a command directly, without forking a shell."""
+        result = subprocess.run(argv, capture_output=True, text=True, cwd=self._work_dir)
+        return result.returncode, result.stdout, result.stderr
+
     def launch(
         self,
         command: str,
@@ -49,14 +90,14 @@ class LocalExecutor:
         exit_file = self._work_dir / ".revis_exit"
         exit_file.unlink(missing_ok=True)
 
-        tmux_cmd = (
-            f"tmux new-session -d -s {session_name} "
-            f"'cd {self._work_dir} && {env_exports}{command}; echo \"EXIT_CODE=$?\" >> .revis_exit'"
+        script = wrap_command(
+            f"cd {self._work_dir} && {env_exports}{command}", str(exit_file), session_name
         )
+        tmux_cmd = f"tmux new-session -d -s {session_name} '{script}'"
 
         exit_code, _, stderr = self._run(tmux_cmd)
         if exit_code != 0:
-            self._run(f"tmux kill-session -t {session_name} 2>/dev/null")
+            self._run_argv("tmux", "kill-session", "-t", session_name)
             exit_code, _, stderr = self._run(tmux_cmd)
             if exit_code != 0:
                 raise RuntimeError(f"Failed to create tmux session: {stderr}")
@@ -65,55 +106,68 @@ class LocalExecutor:
 
     def is_running(self, process_id: str) -> bool:
         """Check if tmux session exists."""
-        exit_code, _, _ = self._run(f"tmux has-session -t {process_id} 2>/dev/null")
+        exit_code, _, _ = self._run_argv("tmux", "has-session", "-t", process_id)
         return exit_code == 0
 
     def wait(self, process_id: str, timeout: int | None = None) -> ExitResult:
-        """Wait for process completion."""
+        """Wait for process completion.
+
+        Blocks on the session's tmux wait-for channel rather than polling, so
+        completion is noticed as soon as the command exits.
+        """
         exit_file = self._work_dir / ".revis_exit"
         start_time = time.time()
-        poll_interval = 5
 
         while True:
-            if not self.is_running(process_id):
-                if exit_file.exists():
-                    content = exit_file.read_text()
-                    exit_file.unlink(missing_ok=True)
-                    if "EXIT_CODE=" in content:
-                        code = int(content.split("EXIT_CODE=")[1].strip())
-                        return ExitResult(
-                            exit_code=code,
-                            failed=code != 0,
-                            error_message=None if code == 0 else f"Process exited with code {code}",
-                        )
-                # No exit file - session ended but we can't verify exit code
-                return ExitResult(
-                    exit_code=-1,
-                    failed=True,
-                    error_message="Process ended but exit code unavailable",
-                )
-
+            block = WAIT_SLICE_SECONDS
             if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
                     self.kill(process_id)
                     return ExitResult(
                         exit_code=-1,
                         failed=True,
                         error_message=f"Process timed out after {timeout}s",
                     )
+                block = max(1, min(block, math.ceil(remaining)))
+
+            self._run(wait_done_command(process_id, block))
 
-            time.sleep(poll_interval)
+            result = self._read_exit_file(exit_file)
+            if result is not None:
+                return result
+            if not self.is_running(process_id):
+                # The exit code is written before the session closes, so check once more
+                result = self._read_exit_file(exit_file)
+                if result is not None:
+                    return result
+                # No exit file - session ended but we can't verify exit code
+                return ExitResult(
+                    exit_code=-1,
+                    failed=True,
+                    error_message="Process ended but exit code unavailable",
+                )
+
+    def _read_exit_file(self, exit_file: Path) -> ExitResult | None:
+        """Consume the exit file if the command has written its exit code."""
+        if not exit_file.exists():
+            return None
+        result = parse_exit_file(exit_file.read_text())
+        if result is not None:
+            exit_file.unlink(missing_ok=True)
+        return result
 
     def kill(self, process_id: str) -> None:
         """Kill tmux session."""
-        self._run(f"tmux kill-session -t {process_id} 2>/dev/null")
+        # Signal completion too, so a blocked wait() returns immediately
+        self._run_argv("tmux", "kill-session", "-t", process_id)
+        self._run_argv("tmux", "wait-for", "-S", done_channel(process_id))
 
     def stream_logs(self, process_id: str, tail_lines: int = 200) -> Iterator[str]:
         """Stream logs from tmux session."""
         while self.is_running(process_id):
-            exit_code, output, _ = self._run(
-                f"tmux capture-pane -t {process_id} -p -S -{tail_lines}"
+            exit_code, output, _ = self._run_argv(
+                "tmux", "capture-pane", "-t", process_id, "-p", "-S", f"-{tail_lines}"
             )
             if exit_code == 0:
                 yield output
@@ -121,15 +175,16 @@ class LocalExecutor:
 
     def get_log_tail(self, log_path: str, lines: int = 200) -> str:
         """Get last N lines of log file."""
-        full_path = self._work_dir / log_path
-        if full_path.exists():
-            exit_code, output, _ = self._run(f"tail -n {lines} {full_path}")
-            return output
-        return ""
+        try:
+            return _read_tail(self._work_dir / log_path, lines).decode(errors="replace")
+        except (FileNotFoundError, IsADirectoryError):
+            return ""
 
     def get_tmux_output(self, session_name: str, lines: int = 200) -> str:
         """Get output from tmux pane."""
-        exit_code, output, _ = self._run(f"tmux capture-pane -t {session_name} -p -S -{lines}")
+        exit_code, output, _ = self._run_argv(
+            "tmux", "capture-pane", "-t", session_name, "-p", "-S", f"-{lines}"
+        )
         return output if exit_code == 0 else ""
 
     def sync_code(self, local_path: Path, remote_path: str) -> None:
@@ -143,23 +198,31 @@ class LocalExecutor:
         local_dest: Path,
     ) -> list[Path]:
         """Collect artifacts matching patterns."""
-        import glob
-
         collected = []
+        dest_root = os.fspath(local_dest)
+        made_dirs: set[str] = set()
 
         for pattern in patterns:
-            full_pattern = str(self._work_dir / pattern)
+            full_pattern = os.path.join(self._work_dir_str, pattern)
             for file_path in glob.glob(full_pattern, recursive=True):
-                path = Path(file_path)
-                if path.is_file() and path.stat().st_mtime >= since_timestamp:
-                    rel_path = path.relative_to(self._work_dir)
-                    dest_path = local_dest / rel_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    if path != dest_path:
-                        import shutil
-
-                        shutil.copy2(path, dest_path)
-                    collected.append(dest_path)
+                # One stat answers both "regular file?" and "new enough?"
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode) or st.st_mtime < since_timestamp:
+                    continue
+
+                dest_path = os.path.join(dest_root, os.path.relpath(file_path, self._work_dir_str))
+                dest_dir = os.path.dirname(dest_path)
+                if dest_dir not in made_dirs:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    made_dirs.add(dest_dir)
+                if file_path != dest_path:
+                    # copyfile takes the kernel copy fast path; only mtime is worth keeping
+                    shutil.copyfile(file_path, dest_path)
+                    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+                collected.append(Path(dest_path))
 
         return collected
 
@@ -174,6 +237,13 @@ class LocalExecutor:
             raise FileNotFoundError(f"File not found: {path}")
         return full_path.read_text()
 
+    def read_file_or_none(self, path: str) -> str | None:
+        """Read file content, or return None if the file does not exist."""
+        try:
+            return (self._work_dir / path).read_text()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
     def reconnect(self) -> bool:
         """No-op for local executor."""
         return True
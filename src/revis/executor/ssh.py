@@ -1,15 +1,62 @@
 """SSH executor implementation using paramiko."""
 
+import contextlib
+import math
 import os
+import select
+import shlex
 import subprocess
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator
 
 import paramiko
 
-from revis.executor.base import ExitResult
+from revis.executor.base import (
+    WAIT_SLICE_SECONDS,
+    ExitResult,
+    done_channel,
+    parse_exit_file,
+    wait_done_command,
+    wrap_command,
+)
+
+# Seconds between SSH keepalive packets, so sshd/NAT don't drop idle pooled connections
+KEEPALIVE_INTERVAL = 30
+
+# Seconds an idle rsync ControlMaster connection stays open
+CONTROL_PERSIST = 600
+
+# Concurrent SFTP downloads when collecting artifacts
+MAX_DOWNLOAD_WORKERS = 8
+
+# Receive window for SFTP channels; paramiko's 2 MiB default stalls prefetch on
+# high-latency links well before the connection is saturated
+SFTP_WINDOW_SIZE = 16 * 1024 * 1024
+
+# Prefix of the per-command sentinel that ends output on the persistent shell
+_SHELL_MARKER = "__REVIS_DONE_"
+
+# Longest a command may run on the persistent shell before it is abandoned
+SHELL_COMMAND_TIMEOUT = 600
+
+# Started through the login shell (so its environment setup runs, as for
+# exec_command), then kept as the user's shell when it is POSIX-compatible
+_SHELL_START = 'exec sh -c \'case "${SHELL##*/}" in bash|zsh|ksh) exec "$SHELL" ;; esac; exec sh\''
+
+# (host, user, port) -> [client, refcount], shared by every executor in the process
+_CLIENT_POOL: dict[tuple[str, str, int], list] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _is_active(client: paramiko.SSHClient) -> bool:
+    """Check whether a client's transport is still connected."""
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
 
 
 @dataclass
@@ -24,27 +71,105 @@ class SSHConfig:
 
 
 class SSHExecutor:
-    """SSH-based remote executor with tmux persistence."""
+    """SSH-based remote executor with tmux persistence.
+
+    Connections are pooled per (host, user, port): executors for the same remote
+    share one transport. Commands run on one persistent shell channel per executor,
+    and SFTP sessions are opened on the same transport.
+    """
 
     def __init__(self, config: SSHConfig):
         self.config = config
         self._client: paramiko.SSHClient | None = None
+        self._holds_pool_ref = False
+        # Long-lived `sh` channel that _exec feeds commands to
+        self._shell: paramiko.Channel | None = None
+        self._shell_lock = threading.RLock()
         self._sftp: paramiko.SFTPClient | None = None
+        self._home: str | None = None
+        self._bsd: bool | None = None
+        # SFTP sessions for concurrent downloads, reused across calls and capped at
+        # MAX_DOWNLOAD_WORKERS so repeated collections don't exhaust sshd's MaxSessions
+        self._worker_sftps: list[paramiko.SFTPClient] = []
+        self._idle_sftps: list[paramiko.SFTPClient] = []
+        self._sftps_opening = 0
+        self._worker_cond = threading.Condition()
+
+    @property
+    def _pool_key(self) -> tuple[str, str, int]:
+        return (self.config.host, self.config.user, self.config.port)
 
     @property
     def client(self) -> paramiko.SSHClient:
-        """Get or create SSH client."""
-        if self._client is None:
-            self._client = self._connect()
+        """Get the pooled SSH client, reconnecting if its transport has dropped."""
+        if self._client is None or not _is_active(self._client):
+            self._close_channels()
+            self._client = self._acquire_client()
         return self._client
 
     @property
     def sftp(self) -> paramiko.SFTPClient:
         """Get or create SFTP client."""
         if self._sftp is None:
-            self._sftp = self.client.open_sftp()
+            self._sftp = self._open_sftp()
         return self._sftp
 
+    def _open_sftp(self) -> paramiko.SFTPClient:
+        """Open an SFTP channel on the shared transport with a large receive window."""
+        return paramiko.SFTPClient.from_transport(
+            self.client.get_transport(), window_size=SFTP_WINDOW_SIZE
+        )
+
+    @contextlib.contextmanager
+    def _borrow_sftp(self) -> Iterator[paramiko.SFTPClient]:
+        """Borrow an SFTP client for the calling thread.
+
+        The main thread uses the executor's own client; worker threads take one
+        from the executor's pool and hand it back when done.
+        """
+        if threading.current_thread() is threading.main_thread():
+            yield self.sftp
+            return
+        sftp = self._checkout_sftp()
+        try:
+            yield sftp
+        finally:
+            self._checkin_sftp(sftp)
+
+    def _checkout_sftp(self) -> paramiko.SFTPClient:
+        """Take an idle pooled SFTP client, opening one if the pool isn't full."""
+        with self._worker_cond:
+            while (
+                not self._idle_sftps
+                and len(self._worker_sftps) + self._sftps_opening >= MAX_DOWNLOAD_WORKERS
+            ):
+                self._worker_cond.wait()
+            if self._idle_sftps:
+                return self._idle_sftps.pop()
+            self._sftps_opening += 1
+        try:
+            sftp = self._open_sftp()
+        except BaseException:
+            with self._worker_cond:
+                self._sftps_opening -= 1
+                self._worker_cond.notify()
+            raise
+        with self._worker_cond:
+            self._sftps_opening -= 1
+            self._worker_sftps.append(sftp)
+        return sftp
+
+    def _checkin_sftp(self, sftp: paramiko.SFTPClient) -> None:
+        """Return a borrowed SFTP client to the pool, dropping it if its channel died."""
+        with self._worker_cond:
+            if sftp in self._worker_sftps:
+                if sftp.get_channel().closed:
+                    self._worker_sftps.remove(sftp)
+                    sftp.close()
+                else:
+                    self._idle_sftps.append(sftp)
+            self._worker_cond.notify()
+
     def _connect(self) -> paramiko.SSHClient:
         """Establish SSH connection."""
         client = paramiko.SSHClient()
@@ -63,38 +188,168 @@ class SSHExecutor:
             connect_kwargs["allow_agent"] = True
 
         client.connect(**connect_kwargs)
+        client.get_transport().set_keepalive(KEEPALIVE_INTERVAL)
         return client
 
+    def _acquire_client(self) -> paramiko.SSHClient:
+        """Get a live client from the pool, connecting if none is live."""
+        with _POOL_LOCK:
+            entry = _CLIENT_POOL.get(self._pool_key)
+            if entry is None:
+                entry = [self._connect(), 0]
+                _CLIENT_POOL[self._pool_key] = entry
+            elif not _is_active(entry[0]):
+                entry[0].close()
+                entry[0] = self._connect()
+            if not self._holds_pool_ref:
+                entry[1] += 1
+                self._holds_pool_ref = True
+            return entry[0]
+
+    def _release_client(self) -> None:
+        """Drop this executor's pool reference, closing the client when unused."""
+        with _POOL_LOCK:
+            self._client = None
+            if not self._holds_pool_ref:
+                return
+            self._holds_pool_ref = False
+            entry = _CLIENT_POOL.get(self._pool_key)
+            if entry is None:
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _CLIENT_POOL[self._pool_key]
+                entry[0].close()
+
     def reconnect(self) -> bool:
         """Attempt to reconnect after connection loss."""
-        self.close()
+        self._close_channels()
+        self._home = None
+        if self._client is not None:
+            # Closing the shared client marks it inactive, so the next acquire replaces it
+            self._client.close()
+            self._client = None
         try:
-            self._client = self._connect()
+            self._client = self._acquire_client()
             return True
         except Exception:
             return False
 
-    def close(self) -> None:
-        """Close SSH connection."""
+    def _close_channels(self) -> None:
+        """Close the shell and SFTP sessions opened on the current client."""
+        with self._shell_lock:
+            if self._shell is not None:
+                self._shell.close()
+                self._shell = None
+        with self._worker_cond:
+            for sftp in self._worker_sftps:
+                sftp.close()
+            self._worker_sftps.clear()
+            self._idle_sftps.clear()
+            self._worker_cond.notify_all()
         if self._sftp is not None:
             self._sftp.close()
             self._sftp = None
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+
+    def close(self) -> None:
+        """Close SSH connection."""
+        self._close_channels()
+        self._release_client()
+        self._home = None
 
     def _exec(self, command: str, timeout: int | None = None) -> tuple[int, str, str]:
-        """Execute command and return (exit_code, stdout, stderr)."""
+        """Execute command and return (exit_code, stdout, stderr).
+
+        Runs on the persistent shell channel, saving a channel open per call.
+        Calls with a timeout, or when no shell can be opened, get their own channel.
+        """
+        if timeout is None:
+            with self._shell_lock:
+                shell = self._open_shell()
+                if shell is not None:
+                    try:
+                        return self._run_in_shell(shell, command)
+                    except TimeoutError as e:
+                        # The command may still be running, so don't re-run it elsewhere
+                        shell.close()
+                        self._shell = None
+                        return -1, "", str(e)
+                    except Exception:
+                        # Output framing is lost; start a fresh shell next time
+                        shell.close()
+                        self._shell = None
+                        raise
+
         stdin, stdout, stderr = self.client.exec_command(command, timeout=timeout)
         exit_code = stdout.channel.recv_exit_status()
         return exit_code, stdout.read().decode(), stderr.read().decode()
 
+    def _open_shell(self) -> paramiko.Channel | None:
+        """Get the persistent shell channel, opening it if needed (caller holds the lock)."""
+        shell = self._shell
+        if shell is not None and not shell.closed and not shell.exit_status_ready():
+            return shell
+        try:
+            shell = self.client.get_transport().open_session()
+            shell.exec_command(_SHELL_START)
+        except (OSError, paramiko.SSHException):
+            self._shell = None
+            return None
+        self._shell = shell
+        return shell
+
+    def _run_in_shell(self, shell: paramiko.Channel, command: str) -> tuple[int, str, str]:
+        """Run one command on the shell and read its output up to the sentinels."""
+        marker = f"{_SHELL_MARKER}{uuid.uuid4().hex}"
+        # eval of a quoted string always parses, so a malformed command fails with a
+        # syntax error instead of leaving the shell waiting for more input. The
+        # subshell keeps cd/exit contained; stdin is detached from the command stream.
+        # The sentinels start on a fresh line, which is stripped again below.
+        shell.sendall(
+            f"(eval {shlex.quote(command)}) </dev/null; "
+            f"printf '\\n{marker} %d\\n' $?; printf '\\n{marker}\\n' >&2\n".encode()
+        )
+        deadline = time.monotonic() + SHELL_COMMAND_TIMEOUT
+
+        out_end = f"\n{marker} ".encode()
+        err_end = f"\n{marker}\n".encode()
+        out, err = bytearray(), bytearray()
+        exit_code = None
+        while exit_code is None or err_end not in err:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Command timed out after {SHELL_COMMAND_TIMEOUT}s")
+            select.select([shell], [], [], 1.0)
+            while shell.recv_ready():
+                out += shell.recv(65536)
+            while shell.recv_stderr_ready():
+                err += shell.recv_stderr(65536)
+            if exit_code is None and out_end in out:
+                tail = out[out.index(out_end) + len(out_end) :]
+                if b"\n" in tail:
+                    exit_code = int(tail[: tail.index(b"\n")])
+            if shell.exit_status_ready() and not (shell.recv_ready() or shell.recv_stderr_ready()):
+                if exit_code is None or err_end not in err:
+                    raise EOFError("Remote shell exited unexpectedly")
+
+        stdout = bytes(out[: out.index(out_end)])
+        stderr = bytes(err[: err.index(err_end)])
+        return exit_code, stdout.decode(), stderr.decode()
+
+    @property
+    def work_dir(self) -> str:
+        """Remote work directory with ~ expanded."""
+        return self._expand_path(self.config.work_dir)
+
     def _expand_path(self, path: str) -> str:
         """Expand ~ in remote path."""
         if path.startswith("~"):
-            exit_code, home, _ = self._exec("echo $HOME")
-            if exit_code == 0:
-                return path.replace("~", home.strip(), 1)
+            # $HOME is fixed for the connection, so resolve it once
+            if self._home is None:
+                exit_code, home, _ = self._exec("echo $HOME")
+                if exit_code != 0:
+                    return path
+                self._home = home.strip()
+            return path.replace("~", self._home, 1)
         return path
 
     # Process management with tmux
@@ -106,7 +361,7 @@ class SSHExecutor:
         session_name: str,
     ) -> str:
         """Launch command in tmux session. Returns session name as process ID."""
-        work_dir = self._expand_path(self.config.work_dir)
+        work_dir = self.work_dir
 
         # Build environment exports (each var needs separate export for safety)
         env_exports = " && ".join(f'export {k}="{v}"' for k, v in env.items())
@@ -114,10 +369,10 @@ class SSHExecutor:
             env_exports = f"{env_exports} && "
 
         # Create tmux session with the command
-        tmux_cmd = (
-            f"tmux new-session -d -s {session_name} "
-            f"'cd {work_dir} && {env_exports}{command}; echo \"EXIT_CODE=$?\" >> .revis_exit'"
+        script = wrap_command(
+            f"cd {work_dir} && {env_exports}{command}", f"{work_dir}/.revis_exit", session_name
         )
+        tmux_cmd = f"tmux new-session -d -s {session_name} '{script}'"
 
         exit_code, _, stderr = self._exec(tmux_cmd)
         if exit_code != 0:
@@ -135,51 +390,57 @@ class SSHExecutor:
         return exit_code == 0
 
     def wait(self, process_id: str, timeout: int | None = None) -> ExitResult:
-        """Wait for process completion."""
-        work_dir = self._expand_path(self.config.work_dir)
+        """Wait for process completion.
+
+        Each round trip blocks remotely on the session's tmux wait-for channel and,
+        once the command has finished, returns the exit file in the same exec.
+        """
+        work_dir = self.work_dir
         exit_file = f"{work_dir}/.revis_exit"
+        ended_marker = "__REVIS_ENDED__"
 
         start_time = time.time()
-        poll_interval = 5  # seconds
 
         while True:
-            # Check if session still exists
-            if not self.is_running(process_id):
-                # Session ended, check exit file
-                exit_code, content, _ = self._exec(
-                    f"cat {exit_file} 2>/dev/null && rm -f {exit_file}"
-                )
-                if exit_code == 0 and "EXIT_CODE=" in content:
-                    code = int(content.split("EXIT_CODE=")[1].strip())
-                    return ExitResult(
-                        exit_code=code,
-                        failed=code != 0,
-                        error_message=None if code == 0 else f"Process exited with code {code}",
-                    )
-                # No exit file - session ended but we can't verify exit code
-                # Assume failure to be safe
-                return ExitResult(
-                    exit_code=-1,
-                    failed=True,
-                    error_message="Process ended but exit code unavailable",
-                )
-
-            # Check timeout
+            block = WAIT_SLICE_SECONDS
             if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
                     self.kill(process_id)
                     return ExitResult(
                         exit_code=-1,
                         failed=True,
                         error_message=f"Process timed out after {timeout}s",
                     )
+                block = max(1, min(block, math.ceil(remaining)))
+
+            _, output, _ = self._exec(
+                f"{wait_done_command(process_id, block)}; "
+                f"if ! tmux has-session -t {process_id} 2>/dev/null "
+                f"|| grep -q EXIT_CODE= {exit_file} 2>/dev/null; then "
+                f"cat {exit_file} 2>/dev/null; rm -f {exit_file}; echo {ended_marker}; fi"
+            )
+            if ended_marker not in output:
+                continue
 
-            time.sleep(poll_interval)
+            result = parse_exit_file(output.replace(ended_marker, ""))
+            if result is not None:
+                return result
+            # No exit file - session ended but we can't verify exit code
+            # Assume failure to be safe
+            return ExitResult(
+                exit_code=-1,
+                failed=True,
+                error_message="Process ended but exit code unavailable",
+            )
 
     def kill(self, process_id: str) -> None:
         """Kill tmux session."""
-        self._exec(f"tmux kill-session -t {process_id} 2>/dev/null")
+        # Signal completion too, so a blocked wait() returns immediately
+        self._exec(
+            f"tmux kill-session -t {process_id} 2>/dev/null; "
+            f"tmux wait-for -S {done_channel(process_id)}"
+        )
 
     # Log collection
 
@@ -196,7 +457,7 @@ class SSHExecutor:
 
     def get_log_tail(self, log_path: str, lines: int = 200) -> str:
         """Get last N lines of a log file."""
-        work_dir = self._expand_path(self.config.work_dir)
+        work_dir = self.work_dir
         full_path = f"{work_dir}/{log_path}"
 
         exit_code, output, stderr = self._exec(f"tail -n {lines} {full_path} 2>/dev/null")
@@ -235,20 +496,35 @@ class SSHExecutor:
             "--exclude=.venv",
             "--exclude=venv",
             "-e",
-            f"ssh -p {self.config.port}",
+            self._rsync_ssh_command(),
             f"{local_path}/",
             f"{self.config.user}@{self.config.host}:{remote_path}/",
         ]
 
-        # Add key if specified
-        if self.config.key_path:
-            key_path = os.path.expanduser(self.config.key_path)
-            rsync_cmd[rsync_cmd.index("-e") + 1] = f"ssh -p {self.config.port} -i {key_path}"
-
         result = subprocess.run(rsync_cmd, capture_output=True, text=True)
         if result.returncode != 0:
             raise RuntimeError(f"rsync failed: {result.stderr}")
 
+    def _rsync_ssh_command(self) -> str:
+        """OpenSSH command for rsync, multiplexed over a shared ControlMaster socket.
+
+        The first sync opens the master; later syncs within CONTROL_PERSIST seconds
+        reuse its TCP/SSH session instead of handshaking again.
+        """
+        control_dir = Path.home() / ".ssh"
+        control_dir.mkdir(mode=0o700, exist_ok=True)
+        # %C hashes host/port/user, keeping the socket path short and per-remote
+        parts = [
+            "ssh",
+            "-o ControlMaster=auto",
+            f"-o ControlPath={control_dir}/revis-mux-%C",
+            f"-o ControlPersist={CONTROL_PERSIST}",
+            f"-p {self.config.port}",
+        ]
+        if self.config.key_path:
+            parts.append(f"-i {os.path.expanduser(self.config.key_path)}")
+        return " ".join(parts)
+
     # Artifact collection
 
     def collect_artifacts(
@@ -257,73 +533,88 @@ class SSHExecutor:
         since_timestamp: float,
         local_dest: Path,
     ) -> list[Path]:
-        """Collect artifacts matching patterns modified after timestamp."""
-        work_dir = self._expand_path(self.config.work_dir)
-        collected = []
-
-        for pattern in patterns:
-            # Find files matching pattern modified after timestamp
-            # Using find with -newer would require a reference file, so use stat
-            find_cmd = f"find {work_dir}/{pattern} -type f 2>/dev/null"
-            exit_code, output, _ = self._exec(find_cmd)
-
-            if exit_code != 0 or not output.strip():
+        """Collect artifacts matching patterns modified after timestamp.
+
+        Paths and mtimes for every pattern come back from a single find/stat
+        exec, and the matching files are downloaded concurrently.
+        """
+        if not patterns:
+            return []
+
+        work_dir = self.work_dir
+        roots = " ".join(f"{work_dir}/{pattern}" for pattern in patterns)
+        stat_fmt = "-f '%m %N'" if self._is_bsd() else "-c '%Y %n'"
+        # Unmatched patterns make find exit non-zero, so use whatever it printed
+        _, output, _ = self._exec(f"find {roots} -type f -exec stat {stat_fmt} {{}} + 2>/dev/null")
+
+        remote_files: dict[str, None] = {}
+        for line in output.splitlines():
+            mtime_str, _, remote_file = line.partition(" ")
+            if not remote_file:
                 continue
-
-            for remote_file in output.strip().split("\n"):
-                if not remote_file:
-                    continue
-
-                # Check modification time
-                stat_cmd = f"stat -c %Y {remote_file} 2>/dev/null"
-                exit_code, mtime_str, _ = self._exec(stat_cmd)
-
-                if exit_code != 0:
-                    # Try macOS stat format
-                    stat_cmd = f"stat -f %m {remote_file} 2>/dev/null"
-                    exit_code, mtime_str, _ = self._exec(stat_cmd)
-
-                if exit_code == 0:
-                    try:
-                        mtime = float(mtime_str.strip())
-                        if mtime < since_timestamp:
-                            continue  # Skip old files
-                    except ValueError:
-                        pass  # Include if we can't parse
-
-                # Download the file
-                rel_path = remote_file.replace(work_dir + "/", "")
-                local_file = local_dest / rel_path
-                local_file.parent.mkdir(parents=True, exist_ok=True)
-
-                try:
-                    self.sftp.get(remote_file, str(local_file))
-                    collected.append(local_file)
-                except Exception as e:
-                    # Log but continue
-                    print(f"Warning: Failed to collect {remote_file}: {e}")
-
-        return collected
+            try:
+                if float(mtime_str) < since_timestamp:
+                    continue  # Skip old files
+            except ValueError:
+                pass  # Include if we can't parse
+            remote_files[remote_file] = None
+
+        def download(remote_file: str) -> Path | None:
+            local_file = local_dest / remote_file.replace(work_dir + "/", "")
+            local_file.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with self._borrow_sftp() as sftp:
+                    sftp.get(remote_file, str(local_file), prefetch=True)
+                return local_file
+            except Exception as e:
+                # Log but continue
+                print(f"Warning: Failed to collect {remote_file}: {e}")
+                return None
+
+        if not remote_files:
+            return []
+        workers = min(MAX_DOWNLOAD_WORKERS, len(remote_files))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(download, remote_files))
+        return [path for path in results if path is not None]
+
+    def _is_bsd(self) -> bool:
+        """Whether the remote has BSD userland (stat -f instead of GNU stat -c)."""
+        if self._bsd is None:
+            exit_code, output, _ = self._exec("uname -s")
+            self._bsd = exit_code == 0 and output.strip() in ("Darwin", "FreeBSD", "OpenBSD")
+        return self._bsd
 
     def download_file(self, remote_path: str, local_path: Path) -> None:
         """Download a single file from remote."""
-        work_dir = self._expand_path(self.config.work_dir)
+        work_dir = self.work_dir
         full_remote = f"{work_dir}/{remote_path}"
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        self.sftp.get(full_remote, str(local_path))
+        with self._borrow_sftp() as sftp:
+            sftp.get(full_remote, str(local_path), prefetch=True)
 
     def file_exists(self, remote_path: str) -> bool:
         """Check if file exists on remote."""
-        work_dir = self._expand_path(self.config.work_dir)
+        work_dir = self.work_dir
         full_path = f"{work_dir}/{remote_path}"
         exit_code, _, _ = self._exec(f"test -f {full_path}")
         return exit_code == 0
 
     def read_file(self, remote_path: str) -> str:
         """Read file content from remote."""
-        work_dir = self._expand_path(self.config.work_dir)
+        work_dir = self.work_dir
         full_path = f"{work_dir}/{remote_path}"
         exit_code, content, _ = self._exec(f"cat {full_path}")
         if exit_code != 0:
             raise FileNotFoundError(f"Remote file not found: {remote_path}")
         return content
+
+    def read_file_or_none(self, remote_path: str) -> str | None:
+        """Read file content from remote in one SFTP exchange, or None if missing."""
+        work_dir = self.work_dir
+        full_path = f"{work_dir}/{remote_path}"
+        try:
+            with self.sftp.open(full_path, "rb") as f:
+                return f.read().decode()
+        except IOError:
+            return None
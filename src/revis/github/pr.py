@@ -1,15 +1,20 @@
 """GitHub PR and branch management."""
 
 import os
+import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
 from github import Github
 from github.GithubException import GithubException
+from github.Repository import Repository
 
 from revis.types import Run, Session, TerminationReason
 
+# owner/repo from SSH (git@host:owner/repo.git) or HTTPS (https://github.com/owner/repo.git)
+_REPO_URL_RE = re.compile(r"(?:^git@[^:]+:|github\.com/)([^/]+)/([^/]+?)(?:\.git)?/?$")
+
 
 @dataclass
 class GitConfig:
@@ -24,24 +29,38 @@ class GitManager:
 
     def __init__(self, config: GitConfig):
         self.config = config
+        # Cached rev-parse/remote results; dropped whenever this manager moves HEAD
+        self._branch: str | None = None
+        self._head_sha: str | None = None
+        self._remote_url: str | None = None
 
     def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
         """Run git command."""
         cmd = ["git", "-C", str(self.config.repo_path)] + list(args)
         return subprocess.run(cmd, capture_output=True, text=True, check=check)
 
+    def _invalidate_head(self) -> None:
+        """Forget cached HEAD state after an operation that moves it."""
+        self._branch = None
+        self._head_sha = None
+
     def get_current_branch(self) -> str:
         """Get current branch name."""
-        result = self._run("rev-parse", "--abbrev-ref", "HEAD")
-        return result.stdout.strip()
+        if self._branch is None:
+            result = self._run("rev-parse", "--abbrev-ref", "HEAD")
+            self._branch = result.stdout.strip()
+        return self._branch
 
     def get_head_sha(self) -> str:
         """Get HEAD commit SHA."""
-        result = self._run("rev-parse", "HEAD")
-        return result.stdout.strip()
+        if self._head_sha is None:
+            result = self._run("rev-parse", "HEAD")
+            self._head_sha = result.stdout.strip()
+        return self._head_sha
 
     def create_branch(self, branch_name: str, base_sha: str | None = None) -> None:
         """Create and checkout a new branch."""
+        self._invalidate_head()
         if base_sha:
             self._run("checkout", "-b", branch_name, base_sha)
         else:
@@ -49,6 +68,7 @@ class GitManager:
 
     def checkout(self, branch_name: str) -> None:
         """Checkout existing branch."""
+        self._invalidate_head()
         self._run("checkout", branch_name)
 
     def stash(self) -> None:
@@ -63,11 +83,11 @@ class GitManager:
     def commit(self, message: str, files: list[str] | None = None) -> str:
         """Stage files and commit. Returns commit SHA."""
         if files:
-            for f in files:
-                self._run("add", f)
+            self._run("add", "--", *files)
         else:
             self._run("add", "-A")
 
+        self._invalidate_head()
         self._run("commit", "-m", message)
         return self.get_head_sha()
 
@@ -85,23 +105,18 @@ class GitManager:
 
     def get_remote_url(self) -> str:
         """Get remote URL."""
-        result = self._run("remote", "get-url", self.config.remote)
-        return result.stdout.strip()
+        if self._remote_url is None:
+            result = self._run("remote", "get-url", self.config.remote)
+            self._remote_url = result.stdout.strip()
+        return self._remote_url
 
     def get_repo_info(self) -> tuple[str, str]:
         """Get owner and repo name from remote URL."""
         url = self.get_remote_url()
-
-        # Handle SSH format: git@github.com:owner/repo.git
-        if url.startswith("git@"):
-            path = url.split(":")[-1]
-        # Handle HTTPS format: https://github.com/owner/repo.git
-        else:
-            path = url.split("github.com/")[-1]
-
-        path = path.rstrip(".git")
-        parts = path.split("/")
-        return parts[0], parts[1]
+        match = _REPO_URL_RE.search(url)
+        if match is None:
+            raise ValueError(f"Cannot parse GitHub owner/repo from remote URL: {url}")
+        return match.group(1), match.group(2)
 
 
 class GitHubManager:
@@ -111,7 +126,17 @@ class GitHubManager:
         self.token = token or os.environ.get("GITHUB_TOKEN")
         if not self.token:
             raise ValueError("GITHUB_TOKEN not set")
-        self.gh = Github(self.token)
+        # Larger pages mean fewer round trips when listing PRs
+        self.gh = Github(self.token, per_page=100)
+        self._repos: dict[str, Repository] = {}
+
+    def _get_repo(self, owner: str, repo: str) -> Repository:
+        """Get a repository, fetching it once per name."""
+        full_name = f"{owner}/{repo}"
+        repository = self._repos.get(full_name)
+        if repository is None:
+            repository = self._repos[full_name] = self.gh.get_repo(full_name)
+        return repository
 
     def create_pr(
         self,
@@ -123,7 +148,7 @@ class GitHubManager:
         base: str = "main",
     ) -> str:
         """Create a pull request. Returns PR URL."""
-        repository = self.gh.get_repo(f"{owner}/{repo}")
+        repository = self._get_repo(owner, repo)
 
         try:
             pr = repository.create_pull(
@@ -143,7 +168,7 @@ class GitHubManager:
 
     def merge_pr(self, owner: str, repo: str, pr_url: str) -> bool:
         """Merge a PR. Returns success."""
-        repository = self.gh.get_repo(f"{owner}/{repo}")
+        repository = self._get_repo(owner, repo)
 
         # Extract PR number from URL
         pr_number = int(pr_url.rstrip("/").split("/")[-1])
@@ -156,6 +181,22 @@ class GitHubManager:
             return False
 
 
+# Result shown in the PR summary for each termination reason
+_RESULT_LABELS = {
+    TerminationReason.TARGET_ACHIEVED: "SUCCESS",
+    TerminationReason.BUDGET_EXHAUSTED: "PROGRESS",
+    TerminationReason.PLATEAU: "PLATEAU",
+    TerminationReason.RETRY_EXHAUSTION: "FAILURE",
+    TerminationReason.LLM_ESCALATION: "ESCALATED",
+    TerminationReason.USER_STOP: "STOPPED",
+}
+
+
+def _truncate(text: str, limit: int = 50) -> str:
+    """Truncate text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
 def format_pr_body(
     session: Session,
     runs: list[Run],
@@ -167,15 +208,7 @@ def format_pr_body(
 ) -> str:
     """Format PR body with session summary."""
     # Determine result status
-    result_map = {
-        TerminationReason.TARGET_ACHIEVED: "SUCCESS",
-        TerminationReason.BUDGET_EXHAUSTED: "PROGRESS",
-        TerminationReason.PLATEAU: "PLATEAU",
-        TerminationReason.RETRY_EXHAUSTION: "FAILURE",
-        TerminationReason.LLM_ESCALATION: "ESCALATED",
-        TerminationReason.USER_STOP: "STOPPED",
-    }
-    result = result_map.get(session.termination_reason, "UNKNOWN")
+    result = _RESULT_LABELS.get(session.termination_reason, "UNKNOWN")
 
     # Calculate final metrics
     final_metrics = {}
@@ -209,28 +242,15 @@ def format_pr_body(
 | {primary_metric} | {baseline_value or "N/A"} | {final_value or "N/A"} | {improvement_str} |"""
 
     # Build key iterations table
-    key_iterations = []
-    for run in runs:
-        run_id = run.id
-        metrics = run_metrics.get(run_id, {})
-        metric_val = metrics.get(primary_metric, "N/A")
-        rationale = decisions.get(run_id, "Initial" if run.iteration_number == 1 else "N/A")
-
-        # Truncate rationale
-        if len(rationale) > 50:
-            rationale = rationale[:47] + "..."
-
-        sha = run.git_sha[:7] if run.git_sha else "N/A"
-        key_iterations.append(f"| {run.iteration_number} | {sha} | {metric_val} | {rationale} |")
-
-    iterations_table = (
-        """| # | Commit | """
-        + primary_metric
-        + """ | Rationale |
-|---|--------|-----|-----------|
-"""
-        + "\n".join(key_iterations)
+    rows = "\n".join(
+        f"| {run.iteration_number} | {(run.git_sha or 'N/A')[:7]} "
+        f"| {run_metrics.get(run.id, {}).get(primary_metric, 'N/A')} "
+        f"| {_truncate(decisions.get(run.id, 'Initial' if run.iteration_number == 1 else 'N/A'))} |"
+        for run in runs
     )
+    iterations_table = f"""| # | Commit | {primary_metric} | Rationale |
+|---|--------|-----|-----------|
+{rows}"""
 
     # Build body
     body = f"""## Session Summary
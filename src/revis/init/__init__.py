@@ -1,5 +1,13 @@
 """Interactive init module for Revis."""
 
-from revis.init.prompts import run_interactive_init
-
 __all__ = ["run_interactive_init"]
+
+
+def __getattr__(name: str):
+    # Resolve lazily so importing revis.init.ssh_config or the metrics sources
+    # doesn't load InquirerPy through the prompts module
+    if name == "run_interactive_init":
+        from revis.init.prompts import run_interactive_init
+
+        return run_interactive_init
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
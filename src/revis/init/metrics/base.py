@@ -19,8 +19,8 @@ class MetricsSource(Protocol):
         """List available projects/experiments."""
         ...
 
-    def list_metrics(self, project: str, limit_runs: int = 10) -> list[str]:
-        """Get metric keys from recent runs in a project."""
+    def list_metrics(self, project: str, limit_runs: int = 10, max_keys: int = 100) -> list[str]:
+        """Get up to max_keys metric keys, sorted, from recent runs in a project."""
         ...
 
     def get_source_type(self) -> str:
@@ -17,9 +17,11 @@ class EvalJsonMetricsSource:
         """Not applicable for eval.json."""
         return []
 
-    def list_metrics(self, project: str = "", limit_runs: int = 10) -> list[str]:
+    def list_metrics(
+        self, project: str = "", limit_runs: int = 10, max_keys: int = 100
+    ) -> list[str]:
         """Return common metric suggestions."""
-        return ["loss", "val_loss", "accuracy", "eval_loss", "perplexity"]
+        return ["loss", "val_loss", "accuracy", "eval_loss", "perplexity"][:max_keys]
 
     def get_source_type(self) -> str:
         return "eval_json"
@@ -1,11 +1,29 @@
 """Weights & Biases metrics source implementation."""
 
+import functools
+import hashlib
+import heapq
+import importlib.util
+import json
 import logging
 import os
+import threading
+import time
+from itertools import islice
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# On-disk cache of W&B listings, so repeated `revis init` runs skip the API
+CACHE_DIR = Path.home() / ".cache" / "revis" / "wandb"
+
+# Seconds to wait on a W&B listing before falling back to cache or manual entry;
+# REVIS_WANDB_API_TIMEOUT overrides
+API_TIMEOUT = 3.0
+
+# Seconds a cached listing stays fresh; REVIS_WANDB_CACHE_TTL overrides (0 disables)
+DEFAULT_CACHE_TTL = 600
+
 EXCLUDED_METRICS = {
     "epoch",
     "step",
@@ -24,17 +42,137 @@ EXCLUDED_METRICS = {
     "timestamp",
 }
 
+# Learning-rate schedules logged per parameter group (e.g. "encoder_lr", "lr_head")
+_LR_SUFFIXES = ("_lr", "_learning_rate")
+_LR_PREFIXES = ("lr_", "learning_rate_")
+
+
+# Only the summary of the newest runs; the stock runs query also pulls config,
+# system metrics and history keys for every run
+RUN_SUMMARIES_QUERY = """
+query RevisRunSummaries($entity: String!, $project: String!, $first: Int!) {
+    project(name: $project, entityName: $entity) {
+        runs(first: $first, order: "-created_at") {
+            edges { node { summaryMetrics } }
+        }
+    }
+}
+"""
+
 
 def is_optimizable_metric(key: str) -> bool:
     """Check if a metric is meaningful to optimize."""
     key_lower = key.lower()
-    if key_lower in EXCLUDED_METRICS:
-        return False
-    if key_lower.endswith("_lr") or key_lower.endswith("_learning_rate"):
-        return False
-    if key_lower.startswith("lr_") or key_lower.startswith("learning_rate_"):
+    return not (
+        key_lower in EXCLUDED_METRICS
+        or key_lower.endswith(_LR_SUFFIXES)
+        or key_lower.startswith(_LR_PREFIXES)
+    )
+
+
+def _cache_ttl() -> float:
+    """Cache TTL in seconds from the environment, falling back to the default."""
+    try:
+        return float(os.environ.get("REVIS_WANDB_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def _api_timeout() -> float:
+    """W&B request timeout in seconds from the environment, falling back to the default."""
+    try:
+        return float(os.environ.get("REVIS_WANDB_API_TIMEOUT", API_TIMEOUT))
+    except ValueError:
+        return API_TIMEOUT
+
+
+def _cache_path(*key: object) -> Path:
+    """Cache file for a listing, named by a hash of its key."""
+    digest = hashlib.sha256("|".join(map(str, key)).encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _read_cache(path: Path, stale_ok: bool = False):
+    """Return the cached value if the file is younger than the TTL, else None.
+
+    With stale_ok, an expired entry is returned too (used when the API fails).
+    """
+    ttl = _cache_ttl()
+    if ttl <= 0:
+        return None
+    try:
+        if not stale_ok and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _call_with_deadline(fn, timeout: float | None = None):
+    """Run fn in a daemon thread, raising TimeoutError if it takes longer than timeout.
+
+    A hung request is abandoned rather than joined, so it can't stall the prompt
+    or interpreter exit.
+    """
+    if timeout is None:
+        timeout = _api_timeout()
+    outcome: dict = {}
+
+    def run() -> None:
+        try:
+            outcome["value"] = fn()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"W&B request timed out after {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def _timeout_fallback(cached) -> str:
+    """Describe what a timed-out listing falls back to, for the warning."""
+    hint = "raise REVIS_WANDB_API_TIMEOUT to wait longer"
+    if cached:
+        return f"showing cached results ({hint})"
+    return f"enter the value manually or {hint}"
+
+
+def _write_cache(path: Path, value) -> None:
+    """Write a cache file via a temp file and rename; failures are ignored."""
+    if _cache_ttl() <= 0:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(value))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Could not write W&B cache {path}: {e}")
+
+
+@functools.lru_cache(maxsize=4)
+def _netrc_has_wandb(netrc_path: str, mtime_ns: int) -> bool:
+    """Whether a netrc file has W&B credentials.
+
+    Keyed on the file's mtime so a fresh `wandb login` is picked up.
+    """
+    try:
+        return "api.wandb.ai" in Path(netrc_path).read_text()
+    except Exception:
         return False
-    return True
+
+
+@functools.cache
+def _shared_api():
+    """One wandb.Api per process, so every source reuses its HTTP session."""
+    import wandb
+
+    return wandb.Api()
 
 
 class WandbMetricsSource:
@@ -51,26 +189,28 @@ class WandbMetricsSource:
             return True
 
         netrc_path = Path.home() / ".netrc"
-        if netrc_path.exists():
-            try:
-                content = netrc_path.read_text()
-                if "api.wandb.ai" in content:
-                    return True
-            except Exception:
-                pass
-        return False
+        try:
+            mtime_ns = netrc_path.stat().st_mtime_ns
+        except OSError:
+            return False
+        return _netrc_has_wandb(str(netrc_path), mtime_ns)
 
     def connect(self) -> bool:
         """Connect to W&B API."""
-        try:
-            import wandb
-        except ImportError:
+        if importlib.util.find_spec("wandb") is None:
             logger.warning("wandb package not installed - run 'pip install wandb'")
             return False
 
         try:
-            self._api = wandb.Api()
-            self._entity = self._api.default_entity
+            self._api = _shared_api()
+            # default_entity is a viewer query; cache it per API key
+            key_hash = hashlib.sha256(str(self._api.api_key).encode()).hexdigest()
+            cache_path = _cache_path("entity", key_hash)
+            self._entity = _read_cache(cache_path)
+            if self._entity is None:
+                self._entity = self._api.default_entity
+                if self._entity:
+                    _write_cache(cache_path, self._entity)
             return True
         except Exception as e:
             logger.warning(f"W&B connection failed: {e}")
@@ -81,32 +221,76 @@ class WandbMetricsSource:
         if self._api is None:
             return []
 
+        cache_path = _cache_path("projects", self._entity)
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return cached
+
         try:
-            projects = self._api.projects(entity=self._entity)
-            return [p.name for p in projects]
-        except Exception:
-            return []
+            projects = _call_with_deadline(
+                lambda: [p.name for p in self._api.projects(entity=self._entity)]
+            )
+        except TimeoutError as e:
+            cached = _read_cache(cache_path, stale_ok=True)
+            logger.warning(f"{e} listing projects; {_timeout_fallback(cached)}")
+            return cached or []
+        except Exception as e:
+            logger.debug(f"Listing W&B projects failed: {e}")
+            return _read_cache(cache_path, stale_ok=True) or []
+        if projects:
+            _write_cache(cache_path, projects)
+        return projects
 
-    def list_metrics(self, project: str, limit_runs: int = 10) -> list[str]:
-        """Get metric keys from recent runs."""
+    def list_metrics(self, project: str, limit_runs: int = 10, max_keys: int = 100) -> list[str]:
+        """Get up to max_keys metric keys, sorted, from recent runs."""
         if self._api is None:
             return []
 
+        cache_path = _cache_path("metrics", self._entity, project, limit_runs, max_keys)
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return cached
+
         try:
-            runs = self._api.runs(
-                path=f"{self._entity}/{project}",
-                per_page=limit_runs,
-            )
+            keys = _call_with_deadline(lambda: self._summary_keys(project, limit_runs))
+        except TimeoutError as e:
+            cached = _read_cache(cache_path, stale_ok=True)
+            logger.warning(f"{e} listing metrics; {_timeout_fallback(cached)}")
+            return cached or []
+        except Exception as e:
+            logger.debug(f"Listing W&B metrics failed: {e}")
+            return _read_cache(cache_path, stale_ok=True) or []
 
-            metric_keys = set()
-            for run in runs:
-                for key in run.summary.keys():
-                    if not key.startswith("_") and is_optimizable_metric(key):
-                        metric_keys.add(key)
+        metric_keys = {k for k in keys if not k.startswith("_") and is_optimizable_metric(k)}
+        # Only the first few keys are shown, so skip sorting the rest
+        metrics = heapq.nsmallest(max_keys, metric_keys)
+        if metrics:
+            _write_cache(cache_path, metrics)
+        return metrics
 
-            return sorted(metric_keys)
-        except Exception:
-            return []
+    def _summary_keys(self, project: str, limit_runs: int) -> set[str]:
+        """Summary keys of the project's latest runs.
+
+        Uses one GraphQL query that selects only summaryMetrics, falling back to
+        loading full Run objects if the query is rejected.
+        """
+        try:
+            from wandb_gql import gql
+
+            result = self._api.client.execute(
+                gql(RUN_SUMMARIES_QUERY),
+                variable_values={"entity": self._entity, "project": project, "first": limit_runs},
+            )
+            edges = result["project"]["runs"]["edges"]
+            return {
+                key for edge in edges for key in json.loads(edge["node"]["summaryMetrics"] or "{}")
+            }
+        except Exception as e:
+            logger.debug(f"W&B summary query failed, loading runs instead: {e}")
+
+        runs = self._api.runs(path=f"{self._entity}/{project}", per_page=limit_runs)
+        # The paginator keeps fetching pages past per_page, so stop at limit_runs
+        return {key for run in islice(runs, limit_runs) for key in run.summary.keys()}
 
     def get_source_type(self) -> str:
         return "wandb"
@@ -1,19 +1,25 @@
 """Interactive prompts for revis init using InquirerPy."""
 
 import os
-import shutil
 from dataclasses import dataclass, field
 
 from InquirerPy import inquirer
 from InquirerPy.base.control import Choice
 from rich.console import Console
 
+from revis.agents.detect import detect_coding_agent
 from revis.init.metrics.eval_json import EvalJsonMetricsSource
 from revis.init.metrics.wandb import WandbMetricsSource
 from revis.init.ssh_config import SSHHost, parse_ssh_config
 
 console = Console()
 
+# Metric suggestions offered before "Other"
+MAX_METRIC_CHOICES = 15
+
+# Entries shown per page when browsing the repo for files to hide
+BROWSE_PAGE_SIZE = 50
+
 
 @dataclass
 class InitConfig:
@@ -39,13 +45,6 @@ class InitConfig:
     extra_deny_patterns: list[str] = field(default_factory=list)
 
 
-def detect_coding_agent() -> str | None:
-    """Detect available coding agents."""
-    if shutil.which("claude"):
-        return "claude-code"
-    return None
-
-
 def prompt_training_command() -> str:
     """Prompt for training command."""
     return inquirer.text(
@@ -132,10 +131,10 @@ def prompt_primary_metric(
 ) -> str:
     """Prompt for primary metric selection."""
     with console.status("[dim]Fetching metrics...[/dim]"):
-        metrics = source.list_metrics(project or "")
+        metrics = source.list_metrics(project or "", max_keys=MAX_METRIC_CHOICES)
 
     if metrics:
-        choices = [Choice(value=m, name=m) for m in metrics[:15]]
+        choices = [Choice(value=m, name=m) for m in metrics]
         choices.append(Choice(value="__other__", name="Other (enter manually)"))
 
         selected = inquirer.select(
@@ -242,6 +241,42 @@ def prompt_coding_agent() -> str:
     ).execute()
 
 
+def _list_browse_dir(
+    path: str, listings: dict[str, tuple[int, list, list]]
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Sorted (name, rel_path) lists of a directory's visible subdirs and files.
+
+    Reuses the previous listing while the directory's mtime is unchanged.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return [], []
+    cached = listings.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    # scandir's d_type avoids a stat per entry
+    try:
+        with os.scandir(path) as it:
+            entries = sorted((e for e in it if not e.name.startswith(".")), key=lambda e: e.name)
+    except OSError:
+        entries = []
+
+    dirs = []
+    files = []
+    for entry in entries:
+        full_path = os.path.join(path, entry.name)
+        rel_path = full_path[2:] if full_path.startswith("./") else full_path
+        if entry.is_dir():
+            dirs.append((entry.name, rel_path))
+        else:
+            files.append((entry.name, rel_path))
+
+    listings[path] = (mtime_ns, dirs, files)
+    return dirs, files
+
+
 def prompt_context_deny() -> list[str]:
     """Prompt for additional files to hide from the LLM."""
     hide_files = inquirer.select(
@@ -258,8 +293,22 @@ def prompt_context_deny() -> list[str]:
 
     selected_patterns: list[str] = []
     current_path = "."
+    page = 0
+    # path -> (mtime_ns, dirs, files), so paging doesn't re-list the directory
+    listings: dict[str, tuple[int, list, list]] = {}
 
     while True:
+        dirs, files = _list_browse_dir(current_path, listings)
+        entries = [("dir", *d) for d in dirs] + [("file", *f) for f in files]
+
+        if not entries:
+            console.print("[dim]No files in this directory.[/dim]")
+            if current_path == ".":
+                return selected_patterns
+            current_path = os.path.dirname(current_path) or "."
+            page = 0
+            continue
+
         # Build choices for current directory
         choices = []
 
@@ -272,45 +321,23 @@ def prompt_context_deny() -> list[str]:
             Choice(value="__done__", name=f"✓ Done ({len(selected_patterns)} selected)")
         )
 
-        # List entries in current directory
-        try:
-            entries = sorted(os.listdir(current_path))
-        except OSError:
-            entries = []
-
-        dirs = []
-        files = []
-        for entry in entries:
-            if entry.startswith("."):
-                continue
-            full_path = os.path.join(current_path, entry)
-            rel_path = full_path[2:] if full_path.startswith("./") else full_path
-            if os.path.isdir(full_path):
-                dirs.append((entry, rel_path))
-            else:
-                files.append((entry, rel_path))
-
-        # Add directories first (navigable)
-        for name, rel_path in dirs:
-            pattern = f"{rel_path}/**"
-            if pattern in selected_patterns:
-                choices.append(Choice(value=f"__dir__:{rel_path}", name=f"[x] {name}/"))
-            else:
-                choices.append(Choice(value=f"__dir__:{rel_path}", name=f"[ ] {name}/"))
-
-        # Add files
-        for name, rel_path in files:
-            if rel_path in selected_patterns:
-                choices.append(Choice(value=f"__file__:{rel_path}", name=f"[x] {name}"))
+        # Only one page of entries is turned into choices
+        start = page * BROWSE_PAGE_SIZE
+        end = start + BROWSE_PAGE_SIZE
+        if page > 0:
+            choices.append(Choice(value="__prev__", name="↑ Previous entries"))
+
+        # Directories first (navigable), then files
+        for kind, name, rel_path in entries[start:end]:
+            if kind == "dir":
+                mark = "x" if f"{rel_path}/**" in selected_patterns else " "
+                choices.append(Choice(value=f"__dir__:{rel_path}", name=f"[{mark}] {name}/"))
             else:
-                choices.append(Choice(value=f"__file__:{rel_path}", name=f"[ ] {name}"))
+                mark = "x" if rel_path in selected_patterns else " "
+                choices.append(Choice(value=f"__file__:{rel_path}", name=f"[{mark}] {name}"))
 
-        if len(choices) <= 2:  # Only back and done
-            console.print("[dim]No files in this directory.[/dim]")
-            if current_path == ".":
-                return selected_patterns
-            current_path = os.path.dirname(current_path) or "."
-            continue
+        if end < len(entries):
+            choices.append(Choice(value="__more__", name=f"→ More ({len(entries) - end} entries)"))
 
         # Show current path
         display_path = current_path if current_path != "." else "(root)"
@@ -321,8 +348,13 @@ def prompt_context_deny() -> list[str]:
 
         if result == "__done__":
             return selected_patterns
+        elif result == "__more__":
+            page += 1
+        elif result == "__prev__":
+            page -= 1
         elif result == "__back__":
             current_path = os.path.dirname(current_path) or "."
+            page = 0
         elif result.startswith("__dir__:"):
             rel_path = result[8:]
             pattern = f"{rel_path}/**"
@@ -342,6 +374,7 @@ def prompt_context_deny() -> list[str]:
                     selected_patterns.append(pattern)
             elif dir_action == "enter":
                 current_path = rel_path
+                page = 0
         elif result.startswith("__file__:"):
             rel_path = result[9:]
             if rel_path in selected_patterns:
@@ -1,5 +1,11 @@
 """SSH config parsing utilities."""
 
+import fnmatch
+import functools
+import glob
+import os
+import re
+import shlex
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,34 +23,41 @@ class SSHHost:
 
 def parse_ssh_config() -> list[SSHHost]:
     """Parse ~/.ssh/config and return list of hosts."""
-    from paramiko.config import SSHConfig
-
     config_path = Path.home() / ".ssh" / "config"
 
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return []
 
+    return list(_parse_ssh_config(str(config_path), mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_ssh_config(config_path: str, mtime_ns: int) -> tuple[SSHHost, ...]:
+    """Parse an SSH config file.
+
+    Keyed on the file's mtime so an edited config is parsed again.
+    """
+    sections: list[tuple[list[str] | None, dict]] = []
     try:
-        config = SSHConfig()
-        with open(config_path) as f:
-            config.parse(f)
-    except Exception:
-        return []
+        _read_sections(Path(config_path), sections, depth=0)
+    except (OSError, UnicodeDecodeError):
+        return ()
 
     hosts = []
     seen_hosts: set[str] = set()
 
-    for entry in config._config:
-        host_patterns = entry.get("host", [])
-        for pattern in host_patterns:
-            if "*" in pattern or "?" in pattern:
+    for patterns, _ in sections:
+        for pattern in patterns or []:
+            if "*" in pattern or "?" in pattern or pattern.startswith("!"):
                 continue
             if pattern in seen_hosts:
                 continue
             seen_hosts.add(pattern)
 
-            host_config = config.lookup(pattern)
-            hostname = host_config.get("hostname", pattern)
+            host_config = _lookup(sections, pattern)
+            hostname = host_config.get("hostname", pattern).replace("%h", pattern)
 
             port = 22
             if "port" in host_config:
@@ -54,7 +67,7 @@ def parse_ssh_config() -> list[SSHHost]:
                     pass
 
             identity_files = host_config.get("identityfile", [])
-            identity_file = identity_files[0] if identity_files else None
+            identity_file = _expand_tokens(identity_files[0], hostname) if identity_files else None
 
             hosts.append(
                 SSHHost(
@@ -66,4 +79,90 @@ def parse_ssh_config() -> list[SSHHost]:
                 )
             )
 
-    return hosts
+    return tuple(hosts)
+
+
+# `Keyword value` or `Keyword=value`
+_LINE_RE = re.compile(r"(\w+)(?:\s*=\s*|\s+)(.+)")
+
+# Include nesting limit, as in OpenSSH
+_MAX_INCLUDE_DEPTH = 16
+
+
+def _read_sections(path: Path, sections: list, depth: int) -> None:
+    """Append (host patterns, options) sections from an ssh_config file.
+
+    Options before the first Host apply to every host; Match blocks are kept
+    with patterns None so they never match. Include is expanded in place.
+    """
+    if not sections:
+        sections.append((["*"], {}))
+
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line.startswith("#"):
+            continue
+        match = _LINE_RE.match(line)
+        if match is None:
+            continue
+        key, value = match.group(1).lower(), match.group(2)
+        try:
+            args = shlex.split(value, comments=True)
+        except ValueError:
+            continue
+        if not args:
+            continue
+
+        if key == "host":
+            sections.append((args, {}))
+        elif key == "match":
+            sections.append((None, {}))
+        elif key == "include":
+            if depth >= _MAX_INCLUDE_DEPTH:
+                continue
+            for arg in args:
+                include = Path(arg).expanduser()
+                if not include.is_absolute():
+                    include = Path.home() / ".ssh" / include
+                for included in sorted(glob.glob(str(include))):
+                    _read_sections(Path(included), sections, depth + 1)
+        else:
+            options = sections[-1][1]
+            if key == "identityfile":
+                options.setdefault(key, []).extend(args)
+            else:
+                options.setdefault(key, " ".join(args))
+
+
+def _lookup(sections: list, host: str) -> dict:
+    """Merge the options of every section matching host; the first value wins."""
+    result: dict = {}
+    for patterns, options in sections:
+        if patterns is None or not _host_matches(host, patterns):
+            continue
+        for key, value in options.items():
+            if key == "identityfile":
+                result.setdefault(key, []).extend(value)
+            else:
+                result.setdefault(key, value)
+    return result
+
+
+def _host_matches(host: str, patterns: list[str]) -> bool:
+    """ssh_config Host matching: any positive pattern matches and no negated one does."""
+    matched = False
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            if fnmatch.fnmatch(host, pattern[1:]):
+                return False
+        elif fnmatch.fnmatch(host, pattern):
+            matched = True
+    return matched
+
+
+def _expand_tokens(value: str, hostname: str) -> str:
+    """Expand the ~, %d and %h tokens ssh allows in IdentityFile."""
+    home = os.path.expanduser("~")
+    if value.startswith("~"):
+        value = home + value[1:]
+    return value.replace("%d", home).replace("%h", hostname)
@@ -1,9 +1,20 @@
 """LLM integration module."""
 
-from revis.llm.agent import AgentResult, run_agent
-from revis.llm.client import LLMClient, LLMResponse, LLMToolResponse
-from revis.llm.prompts import SYSTEM_PROMPT, build_iteration_context
-from revis.llm.tools import TOOLS, ToolExecutor
+import importlib
+
+# Export -> submodule; resolved on first access so importing one submodule
+# (e.g. revis.llm.tools) doesn't load litellm through the client
+_EXPORTS = {
+    "AgentResult": "agent",
+    "run_agent": "agent",
+    "LLMClient": "client",
+    "LLMResponse": "client",
+    "LLMToolResponse": "client",
+    "SYSTEM_PROMPT": "prompts",
+    "build_iteration_context": "prompts",
+    "TOOLS": "tools",
+    "ToolExecutor": "tools",
+}
 
 __all__ = [
     "AgentResult",
@@ -16,3 +27,12 @@ __all__ = [
     "build_iteration_context",
     "run_agent",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"revis.llm.{module}"), name)
+    globals()[name] = value
+    return value
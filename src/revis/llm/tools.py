@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import re
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -187,6 +187,30 @@ TOOLS = [
 ]
 
 
+def _compile_deny_patterns(
+    patterns: list[str],
+) -> tuple[re.Pattern | None, re.Pattern | None]:
+    """Fuse deny globs into one regex for full paths and one for basenames.
+
+    Path alternatives also include the loose "**" form (** -> .*, * -> [^/]*,
+    prefix match); those that aren't valid regexes are left to the glob match.
+    """
+    if not patterns:
+        return None, None
+
+    globs = [translate(pattern) for pattern in patterns]
+    loose = []
+    for pattern in patterns:
+        if "**" in pattern:
+            regex = pattern.replace("**", ".*").replace("*", "[^/]*")
+            try:
+                re.compile(regex)
+            except re.error:
+                continue
+            loose.append(f"(?:{regex})")
+    return re.compile("|".join(globs + loose)), re.compile("|".join(globs))
+
+
 class ToolExecutor:
     """Execute tools for config-only changes."""
 
@@ -199,6 +223,7 @@ class ToolExecutor:
     ):
         self.repo_root = repo_root
         self.deny_patterns = deny_patterns
+        self._deny_path_re, self._deny_name_re = _compile_deny_patterns(deny_patterns)
         self._executor = executor
         self._run_output_dir = run_output_dir
         self.config_changes: list[dict] = []
@@ -208,14 +233,9 @@ class ToolExecutor:
 
     def is_denied(self, path: str) -> bool:
         """Check if path matches any deny pattern."""
-        for pattern in self.deny_patterns:
-            if fnmatch(path, pattern) or fnmatch(Path(path).name, pattern):
-                return True
-            if "**" in pattern:
-                regex_pattern = pattern.replace("**", ".*").replace("*", "[^/]*")
-                if re.match(regex_pattern, path):
-                    return True
-        return False
+        if self._deny_path_re is None:
+            return False
+        return bool(self._deny_path_re.match(path) or self._deny_name_re.match(Path(path).name))
 
     def execute(self, tool_name: str, args: dict) -> str:
         """Execute a tool and return result as string."""
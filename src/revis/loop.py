@@ -11,7 +11,7 @@ from rich.console import Console
 
 from revis.agents.base import HandoffContext
 from revis.agents.detect import get_coding_agent
-from revis.analyzer.compare import RunAnalyzer
+from revis.analyzer.compare import RunAnalyzer, format_run_history
 from revis.analyzer.detectors import GuardrailChecker
 from revis.config import RevisConfig, parse_duration
 from revis.executor.base import Executor
@@ -417,6 +417,7 @@ class RevisLoop:
 
             # Log metrics
             self.store.log_metrics(run_id, eval_result.metrics)
+            self.analyzer.bump(session.id)
             primary_value = eval_result.metrics.get(self.config.metrics.primary)
             logger.info(f"Metrics: {self.config.metrics.primary}={primary_value}")
 
@@ -435,10 +436,9 @@ class RevisLoop:
             prev_runs = self.store.query_runs(session_id=session.id, limit=2)
             prev_eval = None
             if len(prev_runs) > 1:
-                prev_metrics = self.store.get_run_metrics(prev_runs[1].id)
+                prev_metrics = self.store.get_run_metrics_map(prev_runs[1].id)
                 if prev_metrics:
-                    prev_eval_dict = {m.name: m.value for m in prev_metrics}
-                    prev_eval = EvalResult(metrics=prev_eval_dict)
+                    prev_eval = EvalResult(metrics=prev_metrics)
 
             # Analyze run and determine outcome
             analysis = self.analyzer.analyze_run(session, eval_result, prev_eval)
@@ -576,12 +576,17 @@ class RevisLoop:
                 # Hand off to coding agent if available
                 if self.coding_agent is not None:
                     logger.info("Handing off code change to coding agent...")
+                    handoff_timeout = parse_duration(self.config.coding_agent.timeout)
+                    if budget.type == "time":
+                        remaining = budget.value - (time.time() - start_time)
+                        handoff_timeout = max(1, min(handoff_timeout, remaining))
                     handoff_context = HandoffContext(
-                        iteration_history=run_summaries,
+                        iteration_history=format_run_history(run_summaries),
                         latest_metrics=eval_result.metrics,
                         suggestion=request["suggestion"],
-                        relevant_files=request.get("relevant_files", []),
-                        constraints=self.config.context.constraints or None,
+                        relevant_files=tuple(request.get("relevant_files", [])),
+                        constraints=tuple(self.config.context.constraints) or None,
+                        timeout_seconds=handoff_timeout,
                     )
                     handoff_result = self.coding_agent.handoff(handoff_context)
 
@@ -4,8 +4,29 @@ import json
 import logging
 import time
 
+try:
+    import orjson
+except ImportError:  # Optional speedup (pip install revis[fast])
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_NUMERIC = (int, float)
+
+
+def loads_json(content: str | bytes):
+    """Parse JSON with orjson when installed, falling back to the stdlib parser.
+
+    orjson rejects the NaN/Infinity literals json.dump writes for diverged metrics,
+    so documents it can't parse are retried with json.loads (which raises as usual).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class EvalJsonCollector:
     """Collect metrics from eval.json file written by training script."""
@@ -26,22 +47,21 @@ class EvalJsonCollector:
     def get_metrics(self, run_name: str) -> dict[str, float] | None:
         """Get metrics from eval.json."""
         try:
-            if not self.executor.file_exists("eval.json"):
+            content = self.executor.read_file_or_none("eval.json")
+            if content is None:
                 return None
 
-            content = self.executor.read_file("eval.json")
-            data = json.loads(content)
+            data = loads_json(content)
 
             if "metrics" not in data:
                 logger.warning("eval.json missing 'metrics' field")
                 return None
 
-            metrics = {}
-            for key, value in data["metrics"].items():
-                if isinstance(value, (int, float)):
-                    metrics[key] = float(value)
-
-            return metrics
+            return {
+                key: float(value)
+                for key, value in data["metrics"].items()
+                if isinstance(value, _NUMERIC)
+            }
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid eval.json: {e}")
             return None
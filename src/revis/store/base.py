@@ -1,10 +1,20 @@
 """RunStore protocol for session and run persistence."""
 
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from revis.types import Budget, Decision, Run, Session, TerminationReason
 
 
+@dataclass
+class StatusSnapshot:
+    """What `revis status` shows, read from a single database snapshot."""
+
+    running: Session | None
+    orphaned: list[Session] = field(default_factory=list)  # Only when nothing is running
+    recent_runs: list[Run] = field(default_factory=list)  # Newest first
+
+
 class RunStore(Protocol):
     """Protocol for session and run storage."""
 
@@ -112,6 +112,7 @@ CREATE TABLE IF NOT EXISTS traces (
 
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_runs_session ON runs(session_id);
+CREATE INDEX IF NOT EXISTS idx_runs_session_recent ON runs(session_id, started_at, iteration_number);
 CREATE INDEX IF NOT EXISTS idx_metrics_run ON metrics(run_id);
 CREATE INDEX IF NOT EXISTS idx_artifacts_run ON artifacts(run_id);
 CREATE INDEX IF NOT EXISTS idx_decisions_run ON decisions(run_id);
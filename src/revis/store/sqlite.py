@@ -4,9 +4,12 @@ import json
 import os
 import sqlite3
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+from revis.store.base import StatusSnapshot
 from revis.types import (
     Artifact,
     Budget,
@@ -18,6 +21,14 @@ from revis.types import (
     TerminationReason,
 )
 
+# Run duration in whole seconds, NULL until the run has ended
+RUN_DURATION_SQL = "strftime('%s', r.ended_at) - strftime('%s', r.started_at)"
+RUN_SELECT_SQL = f"SELECT r.*, {RUN_DURATION_SQL} AS duration_s FROM runs r"
+
+# Prepared statements kept per connection; the default of 128 is smaller than
+# the number of distinct queries a long-lived loop/watch connection cycles through
+STATEMENT_CACHE_SIZE = 256
+
 
 class SQLiteRunStore:
     """SQLite-based run store."""
@@ -25,23 +36,79 @@ class SQLiteRunStore:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self._conn: sqlite3.Connection | None = None
+        self._txn_depth = 0
 
     @property
     def conn(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE)
             self._conn.row_factory = sqlite3.Row
+            self._configure()
             self._migrate()  # Run migrations on first connection
         return self._conn
 
+    def _configure(self) -> None:
+        """Tune the connection for a loop writing while CLI commands read."""
+        # WAL lets readers (status --watch, show) run alongside the loop's writes.
+        # It needs a real file, so in-memory databases keep the default journal.
+        if str(self.db_path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Memory-map up to 256MB so long-lived readers (status --watch) serve hot pages
+        # from the OS page cache without read() copies
+        self._conn.execute("PRAGMA mmap_size=268435456")
+
+    @contextmanager
+    def write_txn(self) -> Iterator[None]:
+        """Group writes into a single BEGIN IMMEDIATE transaction.
+
+        Taking the write lock up front avoids SQLITE_BUSY when a read would otherwise
+        need upgrading mid-transaction, and the whole block costs one commit.
+        Nested blocks join the outermost transaction.
+        """
+        if self._txn_depth:
+            self._txn_depth += 1
+            try:
+                yield
+            finally:
+                self._txn_depth -= 1
+            return
+
+        conn = self.conn
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        self._txn_depth = 1
+        try:
+            yield
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self._txn_depth = 0
+
+    def _commit(self) -> None:
+        """Commit unless inside write_txn, which commits once at the end."""
+        if not self._txn_depth:
+            self.conn.commit()
+
     def initialize(self) -> None:
         """Initialize the database schema."""
         schema_path = Path(__file__).parent / "schema.sql"
         schema = schema_path.read_text()
-        self.conn.executescript(schema)
-        self.conn.commit()
+        # executescript runs outside the sqlite3 module's transaction handling
+        self.conn.executescript(f"BEGIN IMMEDIATE;\n{schema}\nCOMMIT;")
         self._migrate()
 
+    def data_version(self) -> int:
+        """Counter that changes whenever another connection commits to the database."""
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
     def close(self) -> None:
         if self._conn is not None:
             self._conn.close()
@@ -98,6 +165,10 @@ class SQLiteRunStore:
             )
         """)
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_traces_run ON traces(run_id)")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_runs_session_recent "
+            "ON runs(session_id, started_at, iteration_number)"
+        )
 
         # Add suggestions table if it doesn't exist
         self.conn.execute("""
@@ -116,7 +187,7 @@ class SQLiteRunStore:
             "CREATE INDEX IF NOT EXISTS idx_suggestions_session ON suggestions(session_id)"
         )
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_suggestions_run ON suggestions(run_id)")
-        self.conn.commit()
+        self._commit()
 
     # Session management
 
@@ -148,7 +219,7 @@ class SQLiteRunStore:
                 os.getpid(),
             ),
         )
-        self.conn.commit()
+        self._commit()
         return session_id
 
     def end_session(
@@ -171,7 +242,7 @@ class SQLiteRunStore:
             """,
             (status, reason.value, pr_url, datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"), session_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_session(self, session_id: str) -> Session | None:
         row = self.conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
@@ -187,6 +258,27 @@ class SQLiteRunStore:
             return None
         return self._row_to_session(row)
 
+    def get_status_snapshot(self, limit: int = 5) -> StatusSnapshot:
+        """Get the running session and its latest runs (or orphaned sessions) in one read.
+
+        The queries share a single read transaction, so they see a consistent snapshot.
+        """
+        conn = self.conn
+        own_txn = not conn.in_transaction
+        if own_txn:
+            conn.execute("BEGIN")
+        try:
+            running = self.get_running_session()
+            if running is None:
+                return StatusSnapshot(running=None, orphaned=self.get_orphaned_sessions())
+            return StatusSnapshot(
+                running=running,
+                recent_runs=self.query_runs(session_id=running.id, limit=limit),
+            )
+        finally:
+            if own_txn:
+                conn.commit()
+
     def get_session_by_name(self, name: str) -> Session | None:
         row = self.conn.execute("SELECT * FROM sessions WHERE name = ?", (name,)).fetchone()
         if row is None:
@@ -221,24 +313,24 @@ class SQLiteRunStore:
         runs = self.query_runs(session_id=session_id, limit=1000)
         run_ids = [r.id for r in runs]
 
-        for run_id in run_ids:
-            self.conn.execute("DELETE FROM traces WHERE run_id = ?", (run_id,))
-            self.conn.execute("DELETE FROM decisions WHERE run_id = ?", (run_id,))
-            self.conn.execute("DELETE FROM artifacts WHERE run_id = ?", (run_id,))
-            self.conn.execute("DELETE FROM metrics WHERE run_id = ?", (run_id,))
-            self.conn.execute("DELETE FROM params WHERE run_id = ?", (run_id,))
+        with self.write_txn():
+            for run_id in run_ids:
+                self.conn.execute("DELETE FROM traces WHERE run_id = ?", (run_id,))
+                self.conn.execute("DELETE FROM decisions WHERE run_id = ?", (run_id,))
+                self.conn.execute("DELETE FROM artifacts WHERE run_id = ?", (run_id,))
+                self.conn.execute("DELETE FROM metrics WHERE run_id = ?", (run_id,))
+                self.conn.execute("DELETE FROM params WHERE run_id = ?", (run_id,))
 
-        self.conn.execute("DELETE FROM runs WHERE session_id = ?", (session_id,))
-        self.conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
-        self.conn.commit()
+            self.conn.execute("DELETE FROM runs WHERE session_id = ?", (session_id,))
+            self.conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
         return True
 
     def mark_session_exported(self, session_id: str, pr_url: str | None) -> None:
-        self.conn.execute(
-            "UPDATE sessions SET exported_at = ?, pr_url = ? WHERE id = ?",
-            (datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"), pr_url, session_id),
-        )
-        self.conn.commit()
+        with self.write_txn():
+            self.conn.execute(
+                "UPDATE sessions SET exported_at = ?, pr_url = ? WHERE id = ?",
+                (datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"), pr_url, session_id),
+            )
 
     def session_name_exists(self, name: str) -> bool:
         row = self.conn.execute("SELECT 1 FROM sessions WHERE name = ? LIMIT 1", (name,)).fetchone()
@@ -268,21 +360,21 @@ class SQLiteRunStore:
             "UPDATE sessions SET budget_used = ? WHERE id = ?",
             (budget_used, session_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_session_cost(self, session_id: str, cost_usd: float) -> None:
         self.conn.execute(
             "UPDATE sessions SET llm_cost_usd = ? WHERE id = ?",
             (cost_usd, session_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_session_retry_budget(self, session_id: str, retry_budget: int) -> None:
         self.conn.execute(
             "UPDATE sessions SET retry_budget = ? WHERE id = ?",
             (retry_budget, session_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def resume_session(self, session_id: str) -> None:
         """Set session status back to running for resume."""
@@ -290,14 +382,14 @@ class SQLiteRunStore:
             "UPDATE sessions SET status = 'running', ended_at = NULL, termination_reason = NULL WHERE id = ?",
             (session_id,),
         )
-        self.conn.commit()
+        self._commit()
 
     def increment_iteration(self, session_id: str) -> int:
         self.conn.execute(
             "UPDATE sessions SET iteration_count = iteration_count + 1 WHERE id = ?",
             (session_id,),
         )
-        self.conn.commit()
+        self._commit()
         row = self.conn.execute(
             "SELECT iteration_count FROM sessions WHERE id = ?", (session_id,)
         ).fetchone()
@@ -346,7 +438,7 @@ class SQLiteRunStore:
             """,
             (run_id, session_id, iteration, config_json, datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")),
         )
-        self.conn.commit()
+        self._commit()
         return run_id
 
     def set_run_status(self, run_id: str, status: str) -> None:
@@ -359,37 +451,35 @@ class SQLiteRunStore:
             f"UPDATE runs SET {set_clause} WHERE id = ?",
             (*updates.values(), run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def set_run_commit(self, run_id: str, sha: str) -> None:
         self.conn.execute(
             "UPDATE runs SET git_sha = ? WHERE id = ?",
             (sha, run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def set_run_exit_code(self, run_id: str, exit_code: int) -> None:
         self.conn.execute(
             "UPDATE runs SET exit_code = ? WHERE id = ?",
             (exit_code, run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def log_params(self, run_id: str, params: dict) -> None:
-        for key, value in params.items():
-            self.conn.execute(
+        with self.write_txn():
+            self.conn.executemany(
                 "INSERT OR REPLACE INTO params (run_id, key, value) VALUES (?, ?, ?)",
-                (run_id, key, json.dumps(value)),
+                [(run_id, key, json.dumps(value)) for key, value in params.items()],
             )
-        self.conn.commit()
 
     def log_metrics(self, run_id: str, metrics: dict, step: int | None = None) -> None:
-        for name, value in metrics.items():
-            self.conn.execute(
+        with self.write_txn():
+            self.conn.executemany(
                 "INSERT INTO metrics (run_id, name, value, step) VALUES (?, ?, ?, ?)",
-                (run_id, name, value, step),
+                [(run_id, name, value, step) for name, value in metrics.items()],
             )
-        self.conn.commit()
 
     def log_artifact(self, run_id: str, kind: str, path: str, size_bytes: int | None = None) -> str:
         artifact_id = str(uuid.uuid4())[:8]
@@ -397,7 +487,7 @@ class SQLiteRunStore:
             "INSERT INTO artifacts (id, run_id, kind, path, size_bytes) VALUES (?, ?, ?, ?, ?)",
             (artifact_id, run_id, kind, path, size_bytes),
         )
-        self.conn.commit()
+        self._commit()
         return artifact_id
 
     def query_runs(
@@ -405,8 +495,10 @@ class SQLiteRunStore:
         session_id: str | None = None,
         branch: str | None = None,
         limit: int = 10,
+        ascending: bool = False,
     ) -> list[Run]:
-        query = "SELECT r.* FROM runs r"
+        """Get the latest runs, newest first (or oldest first if ascending)."""
+        query = RUN_SELECT_SQL
         params: list = []
 
         if branch:
@@ -416,12 +508,67 @@ class SQLiteRunStore:
             query += " WHERE r.session_id = ?"
             params.append(session_id)
 
-        query += " ORDER BY r.started_at DESC LIMIT ?"
+        query += " ORDER BY r.started_at DESC, r.iteration_number DESC LIMIT ?"
         params.append(limit)
+        if ascending:
+            query = f"SELECT * FROM ({query}) ORDER BY started_at, iteration_number"
 
         rows = self.conn.execute(query, params).fetchall()
         return [self._row_to_run(row) for row in rows]
 
+    def query_runs_full(
+        self, session_id: str, limit: int = 10, ascending: bool = False
+    ) -> list[tuple[Run, list[Metric], str | None]]:
+        """Get a session's latest runs with their metrics and first decision rationale.
+
+        Fetched in a single JOIN; ordered like query_runs.
+        """
+        run_order = "" if ascending else " DESC"
+        rows = self.conn.execute(
+            f"""
+            SELECT r.*,
+                   {RUN_DURATION_SQL} AS duration_s,
+                   m.name AS metric_name,
+                   m.value AS metric_value,
+                   m.step AS metric_step,
+                   m.logged_at AS metric_logged_at,
+                   (SELECT d.rationale FROM decisions d
+                    WHERE d.run_id = r.id ORDER BY d.rowid LIMIT 1) AS rationale
+            FROM (
+                SELECT * FROM runs WHERE session_id = ?
+                ORDER BY started_at DESC, iteration_number DESC LIMIT ?
+            ) r
+            LEFT JOIN metrics m ON m.run_id = r.id
+            ORDER BY r.started_at{run_order}, r.iteration_number{run_order}, r.id,
+                     m.logged_at, m.id
+            """,
+            (session_id, limit),
+        )
+
+        result: dict[str, tuple[Run, list[Metric], str | None]] = {}
+        for row in rows:
+            entry = result.get(row["id"])
+            if entry is None:
+                entry = result[row["id"]] = (self._row_to_run(row), [], row["rationale"])
+            if row["metric_name"] is not None:
+                entry[1].append(
+                    Metric(
+                        name=row["metric_name"],
+                        value=row["metric_value"],
+                        step=row["metric_step"],
+                        logged_at=datetime.fromisoformat(row["metric_logged_at"]),
+                    )
+                )
+        return list(result.values())
+
+    def get_latest_run_id(self, session_id: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT id FROM runs WHERE session_id = ? "
+            "ORDER BY started_at DESC, iteration_number DESC LIMIT 1",
+            (session_id,),
+        ).fetchone()
+        return row["id"] if row else None
+
     def get_run(self, run_id: str) -> Run | None:
         row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
         if row is None:
@@ -449,6 +596,51 @@ class SQLiteRunStore:
             for row in rows
         ]
 
+    def get_run_metrics_map(self, run_id: str) -> dict[str, float]:
+        """Get a run's metrics as name -> value (latest value wins)."""
+        rows = self.conn.execute(
+            "SELECT name, value FROM metrics WHERE run_id = ? ORDER BY logged_at, id",
+            (run_id,),
+        )
+        return dict(rows.fetchall())
+
+    def get_run_metrics_maps(self, run_ids: list[str]) -> dict[str, dict[str, float]]:
+        """Bulk variant of get_run_metrics_map, keyed by run ID."""
+        result: dict[str, dict[str, float]] = {run_id: {} for run_id in run_ids}
+        for start in range(0, len(run_ids), 500):
+            chunk = run_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT run_id, name, value FROM metrics WHERE run_id IN ({placeholders}) "
+                "ORDER BY logged_at, id",
+                chunk,
+            )
+            for run_id, name, value in rows:
+                result[run_id][name] = value
+        return result
+
+    def get_metric_history(self, session_id: str, name: str, limit: int = 100) -> list[float]:
+        """Get the first logged value of a metric for each of the latest runs, oldest first."""
+        rows = self.conn.execute(
+            """
+            SELECT value FROM (
+                SELECT m.value, r.started_at, r.iteration_number
+                FROM runs r
+                JOIN metrics m ON m.id = (
+                    SELECT id FROM metrics
+                    WHERE run_id = r.id AND name = ?
+                    ORDER BY logged_at, id LIMIT 1
+                )
+                WHERE r.session_id = ?
+                ORDER BY r.started_at DESC, r.iteration_number DESC
+                LIMIT ?
+            )
+            ORDER BY started_at, iteration_number
+            """,
+            (name, session_id, limit),
+        ).fetchall()
+        return [row[0] for row in rows]
+
     def get_run_artifacts(self, run_id: str) -> list[Artifact]:
         rows = self.conn.execute(
             "SELECT * FROM artifacts WHERE run_id = ?",
@@ -486,6 +678,7 @@ class SQLiteRunStore:
             metrics_json=row_dict.get("metrics_json"),
             outcome=row_dict.get("outcome"),
             analysis=row_dict.get("analysis"),
+            duration_s=row_dict.get("duration_s"),
         )
 
     # Decision tracking
@@ -505,7 +698,7 @@ class SQLiteRunStore:
                 decision.commit_sha,
             ),
         )
-        self.conn.commit()
+        self._commit()
         return decision_id
 
     def update_decision_commit(self, decision_id: str, commit_sha: str) -> None:
@@ -513,7 +706,7 @@ class SQLiteRunStore:
             "UPDATE decisions SET commit_sha = ? WHERE id = ?",
             (commit_sha, decision_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_decisions(self, run_id: str) -> list[Decision]:
         rows = self.conn.execute(
@@ -529,6 +722,26 @@ class SQLiteRunStore:
             for row in rows
         ]
 
+    def get_decisions_bulk(self, run_ids: list[str]) -> dict[str, list[Decision]]:
+        """Get decisions for many runs in one query per 500 IDs, keyed by run ID."""
+        result: dict[str, list[Decision]] = {run_id: [] for run_id in run_ids}
+        for start in range(0, len(run_ids), 500):
+            chunk = run_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT * FROM decisions WHERE run_id IN ({placeholders}) ORDER BY rowid",
+                chunk,
+            )
+            for row in rows:
+                result[row["run_id"]].append(
+                    Decision(
+                        action_type=row["action_type"],
+                        rationale=row["rationale"],
+                        commit_sha=row["commit_sha"],
+                    )
+                )
+        return result
+
     # Trace logging
 
     def log_trace(self, run_id: str, event_type: str, data: dict) -> None:
@@ -537,7 +750,7 @@ class SQLiteRunStore:
             "INSERT INTO traces (id, run_id, event_type, data_json) VALUES (?, ?, ?, ?)",
             (trace_id, run_id, event_type, json.dumps(data)),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_traces(self, run_id: str) -> list[dict]:
         query = """
@@ -549,6 +762,32 @@ class SQLiteRunStore:
             {"timestamp": row[0], "event_type": row[1], "data": json.loads(row[2])} for row in rows
         ]
 
+    def get_traces_bulk(
+        self,
+        run_ids: list[str],
+        event_type: str | None = None,
+    ) -> dict[str, list[dict]]:
+        """Get traces for many runs in one query per 500 IDs, keyed by run ID."""
+        result: dict[str, list[dict]] = {run_id: [] for run_id in run_ids}
+        for start in range(0, len(run_ids), 500):
+            chunk = run_ids[start : start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            query = (
+                "SELECT run_id, timestamp, event_type, data_json FROM traces "
+                f"WHERE run_id IN ({placeholders})"
+            )
+            params: list = list(chunk)
+            if event_type is not None:
+                query += " AND event_type = ?"
+                params.append(event_type)
+            query += " ORDER BY timestamp"
+
+            for row in self.conn.execute(query, params):
+                result[row[0]].append(
+                    {"timestamp": row[1], "event_type": row[2], "data": json.loads(row[3])}
+                )
+        return result
+
     # Iteration tracking (new fields on runs)
 
     def update_run_change(
@@ -568,7 +807,7 @@ class SQLiteRunStore:
             """,
             (change_type, change_description, change_diff, hypothesis, run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_run_results(
         self,
@@ -585,7 +824,7 @@ class SQLiteRunStore:
             """,
             (metrics_json, outcome, analysis, run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     # Suggestion management
 
@@ -604,7 +843,7 @@ class SQLiteRunStore:
             """,
             (session_id, run_id, suggestion_type, content),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def update_suggestion_status(
@@ -618,7 +857,7 @@ class SQLiteRunStore:
             "UPDATE suggestions SET status = ?, handed_off_to = ? WHERE id = ?",
             (status, handed_off_to, suggestion_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_suggestions(
         self,
@@ -79,6 +79,9 @@ class Run(BaseModel):
     outcome: Literal["improved", "regressed", "plateau", "failed"] | None = None
     analysis: str | None = None
 
+    # Whole seconds between started_at and ended_at, computed by the store query
+    duration_s: int | None = None
+
 
 class Metric(BaseModel):
     """A logged metric."""
@@ -0,0 +1,67 @@
+"""Tests for CLI helpers."""
+
+from types import SimpleNamespace
+
+from revis.cli import SESSION_NAME_RE, _run_metrics, _write_atomic, format_duration, tail_lines
+
+
+class TestTailLines:
+    def test_last_lines(self, tmp_path):
+        path = tmp_path / "session.log"
+        path.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+        assert tail_lines(path, 3, block_size=16) == ["line 997", "line 998", "line 999"]
+
+    def test_short_file(self, tmp_path):
+        path = tmp_path / "session.log"
+        path.write_text("first\nsecond")
+
+        assert tail_lines(path, 50) == ["first", "second"]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "session.log"
+        path.write_text("")
+
+        assert tail_lines(path, 5) == []
+
+
+class TestSessionNameValidation:
+    def test_valid_names(self):
+        for name in ["exp1", "lr-sweep_2", "A"]:
+            assert SESSION_NAME_RE.match(name)
+
+    def test_invalid_names(self):
+        for name in ["", "-", "_x", "has space", "semi;colon", "trailing\n"]:
+            assert not SESSION_NAME_RE.match(name)
+
+
+class TestWriteAtomic:
+    def test_replaces_contents(self, tmp_path):
+        path = tmp_path / ".gitignore"
+        path.write_text("old\n")
+
+        _write_atomic(path, "old\nnew\n")
+
+        assert path.read_text() == "old\nnew\n"
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestFormatDuration:
+    def test_formats(self):
+        assert format_duration(45) == "45s"
+        assert format_duration(61) == "1m 1s"
+        assert format_duration(3661) == "1h 1m"
+        assert format_duration(90000) == "25h 0m"
+
+
+class TestRunMetrics:
+    def test_snapshot_overlays_logged_metrics(self):
+        run = SimpleNamespace(metrics_json='{"loss": 0.4}')
+        logged = [SimpleNamespace(name="loss", value=0.5), SimpleNamespace(name="acc", value=0.9)]
+
+        assert _run_metrics(run, logged) == {"loss": 0.4, "acc": 0.9}
+
+    def test_no_snapshot(self):
+        run = SimpleNamespace(metrics_json=None)
+
+        assert _run_metrics(run, [SimpleNamespace(name="loss", value=0.5)]) == {"loss": 0.5}
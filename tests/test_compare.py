@@ -0,0 +1,111 @@
+"""Tests for RunAnalyzer."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from revis.analyzer.compare import RunAnalyzer, RunSummary, format_run_history
+from revis.store.sqlite import SQLiteRunStore
+from revis.types import Budget, EvalResult
+
+
+@pytest.fixture
+def store():
+    """Create a temporary SQLite store."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+
+    store = SQLiteRunStore(db_path)
+    store.initialize()
+    yield store
+    store.close()
+    db_path.unlink()
+
+
+@pytest.fixture
+def session_id(store):
+    return store.create_session(
+        name="analyzer",
+        branch="revis/analyzer",
+        base_sha="abc123",
+        budget=Budget(type="runs", value=10),
+    )
+
+
+def log_run(store, session_id, iteration, metrics):
+    run_id = store.create_run(session_id=session_id, config_json="{}", iteration=iteration)
+    store.log_metrics(run_id, metrics)
+    return run_id
+
+
+class TestMetricHistory:
+    def test_history_oldest_first(self, store, session_id):
+        for i, loss in enumerate([1.0, 0.8, 0.6]):
+            log_run(store, session_id, i + 1, {"loss": loss})
+
+        analyzer = RunAnalyzer(store, primary_metric="loss")
+
+        assert analyzer.get_metric_history(session_id) == [1.0, 0.8, 0.6]
+        assert analyzer.get_initial_value(session_id) == 1.0
+
+    def test_history_refreshes_on_new_run(self, store, session_id):
+        log_run(store, session_id, 1, {"loss": 1.0})
+        analyzer = RunAnalyzer(store, primary_metric="loss")
+        assert analyzer.get_metric_history(session_id) == [1.0]
+
+        log_run(store, session_id, 2, {"loss": 0.5})
+
+        assert analyzer.get_metric_history(session_id) == [1.0, 0.5]
+
+    def test_bump_invalidates_cache(self, store, session_id):
+        run_id = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        analyzer = RunAnalyzer(store, primary_metric="loss")
+        assert analyzer.get_metric_history(session_id) == []
+
+        store.log_metrics(run_id, {"loss": 0.7})
+        analyzer.bump(session_id)
+
+        assert analyzer.get_metric_history(session_id) == [0.7]
+
+
+class TestCompareToPrevious:
+    def test_minimize_improvement_positive(self, store):
+        analyzer = RunAnalyzer(store, primary_metric="loss", minimize=True)
+        comparison = analyzer.compare_to_previous(
+            EvalResult(metrics={"loss": 0.8}),
+            EvalResult(metrics={"loss": 1.0}),
+            baseline_eval=EvalResult(metrics={"loss": 2.0}),
+        )
+
+        assert comparison.delta_from_previous == pytest.approx(-0.2)
+        assert comparison.improvement_from_previous == pytest.approx(0.2)
+        assert comparison.improvement_from_baseline == pytest.approx(0.6)
+
+    def test_maximize_improvement_positive(self, store):
+        analyzer = RunAnalyzer(store, primary_metric="accuracy", minimize=False)
+        comparison = analyzer.compare_to_previous(
+            EvalResult(metrics={"accuracy": 0.9}),
+            EvalResult(metrics={"accuracy": 0.8}),
+        )
+
+        assert comparison.improvement_from_previous == pytest.approx(0.125)
+        assert comparison.baseline_value is None
+
+
+class TestFormatRunHistory:
+    def test_empty(self):
+        assert format_run_history([]) == "No previous runs."
+
+    def test_two_lines_per_run(self):
+        summaries = [
+            RunSummary(1, {"loss": 1.0}, "Initial run", "loss: 1.0000"),
+            RunSummary(2, {"loss": 0.5}, "Raised lr", "loss: 1.0000 → 0.5000 (-50.0%)"),
+        ]
+
+        assert format_run_history(summaries) == (
+            "Run #1: Initial run\n"
+            "  Result: loss: 1.0000\n"
+            "Run #2: Raised lr\n"
+            "  Result: loss: 1.0000 → 0.5000 (-50.0%)"
+        )
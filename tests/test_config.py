@@ -6,8 +6,10 @@ from pathlib import Path
 import pytest
 
 from revis.config import (
+    CONFIG_CACHE_FILE,
     RevisConfig,
     get_config_template,
+    get_config_template_bytes,
     load_config,
     parse_duration,
 )
@@ -63,6 +65,9 @@ class TestConfigTemplate:
         assert data["entry"]["train"] == "python train.py"
         assert data["metrics"]["primary"] == "loss"
 
+    def test_template_bytes_match_template(self):
+        assert get_config_template_bytes().decode("utf-8") == get_config_template()
+
 
 class TestLoadConfig:
     def test_load_minimal_config(self):
@@ -149,3 +154,46 @@ llm:
             assert config.context.max_agent_iterations == 15
             assert len(config.llm.fallback) == 1
             assert len(config.context.constraints) == 1
+
+
+class TestConfigCache:
+    CONFIG_YAML = """
+executor:
+  type: local
+
+entry:
+  train: "python train.py"
+
+metrics:
+  primary: {primary}
+"""
+
+    def test_reuses_cached_config(self, tmp_path):
+        (tmp_path / ".revis").mkdir()
+        path = tmp_path / "revis.yaml"
+        path.write_text(self.CONFIG_YAML.format(primary="loss"))
+
+        first = load_config(path)
+        assert (tmp_path / CONFIG_CACHE_FILE).exists()
+
+        second = load_config(path)
+        assert second == first
+        assert second is not first
+
+    def test_invalidated_on_change(self, tmp_path):
+        (tmp_path / ".revis").mkdir()
+        path = tmp_path / "revis.yaml"
+        path.write_text(self.CONFIG_YAML.format(primary="loss"))
+        load_config(path)
+
+        path.write_text(self.CONFIG_YAML.format(primary="accuracy"))
+
+        assert load_config(path).metrics.primary == "accuracy"
+
+    def test_no_cache_outside_project(self, tmp_path):
+        path = tmp_path / "revis.yaml"
+        path.write_text(self.CONFIG_YAML.format(primary="loss"))
+
+        load_config(path)
+
+        assert not (tmp_path / ".revis").exists()
@@ -82,6 +82,12 @@ class TestDetectPlateau:
         assert result.triggered
         assert "Plateau" in result.message
 
+    def test_new_value_appended(self):
+        history = [0.5, 0.4, 0.3, 0.2999, 0.2998]
+        assert not detect_plateau(history, threshold=0.01, n_runs=3).triggered
+        result = detect_plateau(history, threshold=0.01, n_runs=3, new_value=0.2997)
+        assert result.triggered
+
     def test_maximize_mode(self):
         history = [0.5, 0.6, 0.7, 0.701, 0.702, 0.703]
         result = detect_plateau(history, threshold=0.01, n_runs=3, minimize=False)
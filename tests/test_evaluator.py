@@ -4,7 +4,8 @@ import json
 
 import pytest
 
-from revis.evaluator.harness import validate_eval_schema
+from revis.evaluator.harness import EvalHarness, validate_eval_schema
+from revis.executor.local import LocalConfig, LocalExecutor
 from revis.types import EvalResult
 
 
@@ -74,3 +75,49 @@ class TestEvalResult:
         result = EvalResult(metrics={"loss": 0.5})
         assert result.slices == {}
         assert result.plots == []
+
+
+class TestParseEvalJson:
+    def test_parses_metrics(self):
+        result = EvalHarness(executor=None).parse_eval_json(
+            json.dumps({"metrics": {"loss": 0.5}, "plots": ["a.png"]})
+        )
+        assert result.metrics == {"loss": 0.5}
+        assert result.plots == ["a.png"]
+
+    def test_nan_metric(self):
+        result = EvalHarness(executor=None).parse_eval_json('{"metrics": {"loss": NaN}}')
+        assert result.metrics["loss"] != result.metrics["loss"]
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError, match="Invalid eval.json"):
+            EvalHarness(executor=None).parse_eval_json("{not json")
+
+    def test_reports_all_non_numeric_metrics(self):
+        with pytest.raises(ValueError, match=r"'a' \(str\), 'b' \(list\)"):
+            EvalHarness(executor=None).parse_eval_json(
+                json.dumps({"metrics": {"a": "x", "loss": 0.5, "b": [1]}})
+            )
+
+
+class TestCollect:
+    def test_collects_eval_json(self, tmp_path):
+        (tmp_path / "eval.json").write_text(json.dumps({"metrics": {"loss": 0.25}}))
+        harness = EvalHarness(LocalExecutor(LocalConfig(work_dir=str(tmp_path))))
+        assert harness.collect().metrics == {"loss": 0.25}
+
+    def test_missing_eval_json(self, tmp_path):
+        harness = EvalHarness(LocalExecutor(LocalConfig(work_dir=str(tmp_path))))
+        with pytest.raises(FileNotFoundError, match="eval.json"):
+            harness.collect()
+
+    def test_collect_plots_keeps_order_and_skips_failures(self, tmp_path):
+        class PlotExecutor:
+            def download_file(self, remote_path, local_path):
+                if remote_path == "missing.png":
+                    raise FileNotFoundError(remote_path)
+                local_path.write_text(remote_path)
+
+        plots = [f"p{i}.png" for i in range(10)] + ["missing.png"]
+        collected = EvalHarness(PlotExecutor()).collect_plots(plots, tmp_path)
+        assert collected == [tmp_path / f"p{i}.png" for i in range(10)]
@@ -0,0 +1,104 @@
+"""Tests for executor helpers."""
+
+import os
+import subprocess
+import time
+from types import SimpleNamespace
+
+from revis.executor.base import parse_exit_file, wrap_command
+from revis.executor.local import LocalConfig, LocalExecutor
+from revis.executor.ssh import MAX_DOWNLOAD_WORKERS, SSHConfig, SSHExecutor
+
+
+class TestExitFile:
+    def test_success(self):
+        result = parse_exit_file("EXIT_CODE=0\n")
+        assert result.exit_code == 0
+        assert not result.failed
+
+    def test_failure(self):
+        result = parse_exit_file("EXIT_CODE=2\n")
+        assert result.failed
+        assert result.error_message == "Process exited with code 2"
+
+    def test_missing_code(self):
+        assert parse_exit_file("") is None
+
+
+class TestWrapCommand:
+    def test_records_code_when_command_exits(self, tmp_path):
+        exit_file = tmp_path / ".revis_exit"
+        script = wrap_command("exit 3", str(exit_file), "revis-test")
+        # Drop the tmux signal so the script runs without a tmux server
+        script = script.rsplit(";", 1)[0]
+        subprocess.run(script, shell=True, check=True)
+        assert parse_exit_file(exit_file.read_text()).exit_code == 3
+
+
+class TestLocalLogTail:
+    def test_last_lines(self, tmp_path):
+        (tmp_path / "train.log").write_text("".join(f"line {i}\n" for i in range(1000)))
+        executor = LocalExecutor(LocalConfig(work_dir=str(tmp_path)))
+        assert executor.get_log_tail("train.log", lines=2) == "line 998\nline 999\n"
+
+    def test_missing_log(self, tmp_path):
+        executor = LocalExecutor(LocalConfig(work_dir=str(tmp_path)))
+        assert executor.get_log_tail("missing.log") == ""
+
+
+class TestLocalCollectArtifacts:
+    def test_copies_new_matches(self, tmp_path):
+        work = tmp_path / "work"
+        (work / "plots").mkdir(parents=True)
+        (work / "plots" / "loss.png").write_bytes(b"png")
+        (work / "plots" / "old.png").write_bytes(b"old")
+        os.utime(work / "plots" / "old.png", (0, 0))
+        dest = tmp_path / "dest"
+
+        executor = LocalExecutor(LocalConfig(work_dir=str(work)))
+        collected = executor.collect_artifacts(["plots/*.png"], 1.0, dest)
+
+        assert collected == [dest / "plots" / "loss.png"]
+        assert collected[0].read_bytes() == b"png"
+        assert collected[0].stat().st_mtime == (work / "plots" / "loss.png").stat().st_mtime
+
+
+class _FakeSFTP:
+    def __init__(self):
+        self.closed = False
+
+    def get_channel(self):
+        return SimpleNamespace(closed=self.closed)
+
+    def get(self, remote, local, prefetch=True):
+        time.sleep(0.01)
+        with open(local, "w") as f:
+            f.write(remote)
+
+    def close(self):
+        self.closed = True
+
+
+class TestSSHCollectArtifacts:
+    def test_reuses_sftp_channels_across_calls(self, tmp_path):
+        executor = SSHExecutor(SSHConfig(host="gpu", user="me", work_dir="/work"))
+        opened: list[_FakeSFTP] = []
+
+        def open_sftp():
+            opened.append(_FakeSFTP())
+            return opened[-1]
+
+        listing = "\n".join(f"100 /work/out/{i}.png" for i in range(20))
+        executor._open_sftp = open_sftp
+        executor._exec = lambda command, timeout=None: (0, listing, "")
+
+        first = executor.collect_artifacts(["out/*.png"], 0, tmp_path / "a")
+        channels = len(opened)
+        second = executor.collect_artifacts(["out/*.png"], 0, tmp_path / "b")
+
+        assert len(first) == len(second) == 20
+        assert 0 < channels <= MAX_DOWNLOAD_WORKERS
+        assert len(opened) == channels
+
+        executor.close()
+        assert all(sftp.closed for sftp in opened)
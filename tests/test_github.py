@@ -0,0 +1,49 @@
+"""Tests for git helpers."""
+
+import subprocess
+
+import pytest
+
+from revis.github.pr import GitConfig, GitManager
+
+
+def _git(path, *args):
+    subprocess.run(["git", "-C", str(path), *args], check=True, capture_output=True)
+
+
+class TestGitManager:
+    def test_head_cache_follows_commits_and_checkouts(self, tmp_path):
+        _git(tmp_path, "init", "-q", "-b", "main")
+        _git(tmp_path, "config", "user.email", "test@example.com")
+        _git(tmp_path, "config", "user.name", "test")
+        git = GitManager(GitConfig(repo_path=tmp_path))
+
+        (tmp_path / "a.txt").write_text("a")
+        first = git.commit("first")
+        assert git.get_head_sha() == first
+
+        git.create_branch("feature")
+        assert git.get_current_branch() == "feature"
+
+        (tmp_path / "b.txt").write_text("b")
+        second = git.commit("second")
+        assert second != first
+        assert git.get_head_sha() == second
+
+        git.checkout("main")
+        assert git.get_current_branch() == "main"
+        assert git.get_head_sha() == first
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "git@github.com:owner/tig.git",
+            "https://github.com/owner/tig",
+            "https://github.com/owner/tig.git",
+            "ssh://git@github.com/owner/tig.git",
+        ],
+    )
+    def test_repo_info(self, tmp_path, url):
+        git = GitManager(GitConfig(repo_path=tmp_path))
+        git._remote_url = url
+        assert git.get_repo_info() == ("owner", "tig")
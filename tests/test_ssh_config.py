@@ -0,0 +1,42 @@
+"""Tests for ssh config parsing."""
+
+from revis.init.ssh_config import SSHHost, parse_ssh_config
+
+
+class TestParseSSHConfig:
+    def test_hosts_merge_matching_sections(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / ".ssh").mkdir()
+        (tmp_path / ".ssh" / "config").write_text(
+            "User everyone\n"
+            "\n"
+            "Host gpu1 gpu2\n"
+            "    HostName %h.cluster.example.com\n"
+            "    Port 2222\n"
+            "    IdentityFile ~/.ssh/id_%h\n"
+            "\n"
+            "Host box\n"
+            "  HostName=10.0.0.5  # inline comment\n"
+            "\n"
+            "Host *\n"
+            "  Port 22\n"
+        )
+
+        hosts = parse_ssh_config()
+
+        key = str(tmp_path / ".ssh" / "id_gpu1.cluster.example.com")
+        assert hosts[0] == SSHHost("gpu1", "gpu1.cluster.example.com", "everyone", 2222, key)
+        assert hosts[2] == SSHHost("box", "10.0.0.5", "everyone", 22, None)
+        assert [h.name for h in hosts] == ["gpu1", "gpu2", "box"]
+
+    def test_include(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        (tmp_path / ".ssh" / "conf.d").mkdir(parents=True)
+        (tmp_path / ".ssh" / "config").write_text("Include conf.d/*\n")
+        (tmp_path / ".ssh" / "conf.d" / "lab").write_text("Host lab\n  User me\n")
+
+        assert parse_ssh_config() == [SSHHost("lab", "lab", "me")]
+
+    def test_missing_config(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert parse_ssh_config() == []
@@ -23,6 +23,68 @@ def store():
     db_path.unlink()
 
 
+def test_connection_uses_wal(store):
+    mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_connection_is_reused(store):
+    conn = store.conn
+    store.get_status_snapshot()
+    assert store.conn is conn
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+def test_migrate_adds_recent_runs_index(store):
+    store.conn.execute("DROP INDEX idx_runs_session_recent")
+    store.conn.commit()
+    store.close()
+
+    reopened = SQLiteRunStore(store.db_path)
+    indexes = {
+        row[0]
+        for row in reopened.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    reopened.close()
+    assert "idx_runs_session_recent" in indexes
+
+
+def test_data_version_tracks_other_connections(store):
+    before = store.data_version()
+    assert store.data_version() == before
+
+    other = SQLiteRunStore(store.db_path)
+    other.create_session(
+        name="writer", branch="revis/writer", base_sha="abc", budget=Budget(type="runs", value=1)
+    )
+    other.close()
+
+    assert store.data_version() != before
+
+
+class TestWriteTransaction:
+    def test_commits_once(self, store):
+        budget = Budget(type="runs", value=1)
+        with store.write_txn():
+            store.create_session(name="a", branch="revis/a", base_sha="a", budget=budget)
+            with store.write_txn():
+                store.create_session(name="b", branch="revis/b", base_sha="b", budget=budget)
+            assert store.conn.in_transaction
+
+        assert not store.conn.in_transaction
+        assert store.session_name_exists("a")
+        assert store.session_name_exists("b")
+
+    def test_rolls_back_on_error(self, store):
+        budget = Budget(type="runs", value=1)
+        with pytest.raises(RuntimeError):
+            with store.write_txn():
+                store.create_session(name="a", branch="revis/a", base_sha="a", budget=budget)
+                raise RuntimeError("boom")
+
+        assert not store.session_name_exists("a")
+
+
 class TestSessionManagement:
     def test_create_session(self, store):
         budget = Budget(type="time", value=3600)
@@ -74,6 +136,22 @@ class TestSessionManagement:
         running = store.get_running_session()
         assert running is None
 
+    def test_status_snapshot(self, store):
+        assert store.get_status_snapshot().running is None
+
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="snapshot", branch="revis/snapshot", base_sha="nnn444", budget=budget
+        )
+        for i in range(3):
+            store.create_run(session_id=session_id, config_json="{}", iteration=i + 1)
+
+        snapshot = store.get_status_snapshot(limit=2)
+        assert snapshot.running.id == session_id
+        assert snapshot.orphaned == []
+        assert [r.iteration_number for r in snapshot.recent_runs] == [3, 2]
+        assert not store.conn.in_transaction
+
     def test_end_session(self, store):
         budget = Budget(type="time", value=3600)
         session_id = store.create_session(
@@ -207,6 +285,66 @@ class TestRunManagement:
         runs = store.query_runs(session_id=session_id, limit=3)
 
         assert len(runs) == 3
+        assert [r.iteration_number for r in runs] == [5, 4, 3]
+
+        runs = store.query_runs(session_id=session_id, limit=3, ascending=True)
+        assert [r.iteration_number for r in runs] == [3, 4, 5]
+
+    def test_query_runs_duration(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="duration", branch="revis/duration", base_sha="mmm333", budget=budget
+        )
+
+        run_id = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        assert store.query_runs(session_id=session_id)[0].duration_s is None
+
+        store.conn.execute(
+            "UPDATE runs SET started_at = '2024-01-01 10:00:00', "
+            "ended_at = '2024-01-01 11:02:05' WHERE id = ?",
+            (run_id,),
+        )
+        assert store.query_runs(session_id=session_id)[0].duration_s == 3725
+        assert store.query_runs_full(session_id)[0][0].duration_s == 3725
+
+    def test_query_runs_full(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="full", branch="revis/full", base_sha="kkk111", budget=budget
+        )
+
+        run1 = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        run2 = store.create_run(session_id=session_id, config_json="{}", iteration=2)
+        store.log_metrics(run1, {"loss": 0.5, "acc": 0.8})
+        store.attach_decision(run1, Decision(action_type="code_patch", rationale="first"))
+        store.attach_decision(run1, Decision(action_type="code_patch", rationale="second"))
+
+        full = {
+            run.id: (metrics, rationale)
+            for run, metrics, rationale in store.query_runs_full(session_id, limit=10)
+        }
+
+        assert sorted(m.name for m in full[run1][0]) == ["acc", "loss"]
+        assert full[run1][1] == "first"
+        assert full[run2] == ([], None)
+
+    def test_get_latest_run_id(self, store):
+        budget = Budget(type="runs", value=10)
+        session_id = store.create_session(
+            name="latest",
+            branch="revis/latest",
+            base_sha="fff777",
+            budget=budget,
+        )
+
+        assert store.get_latest_run_id(session_id) is None
+
+        run_ids = [
+            store.create_run(session_id=session_id, config_json="{}", iteration=i + 1)
+            for i in range(3)
+        ]
+
+        assert store.get_latest_run_id(session_id) == run_ids[-1]
 
     def test_log_metrics(self, store):
         budget = Budget(type="runs", value=5)
@@ -229,6 +367,44 @@ class TestRunManagement:
         assert len(metrics) == 2
         assert any(m.name == "loss" and m.value == 0.5 for m in metrics)
 
+    def test_get_run_metrics_map(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="metricsmap",
+            branch="revis/metricsmap",
+            base_sha="ggg000",
+            budget=budget,
+        )
+
+        run_a = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        run_b = store.create_run(session_id=session_id, config_json="{}", iteration=2)
+        store.log_metrics(run_a, {"loss": 0.5, "accuracy": 0.9})
+        store.log_metrics(run_a, {"loss": 0.3})
+
+        assert store.get_run_metrics_map(run_a) == {"loss": 0.3, "accuracy": 0.9}
+        assert store.get_run_metrics_maps([run_a, run_b]) == {
+            run_a: {"loss": 0.3, "accuracy": 0.9},
+            run_b: {},
+        }
+
+    def test_get_metric_history(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="history",
+            branch="revis/history",
+            base_sha="ggg999",
+            budget=budget,
+        )
+
+        for i, loss in enumerate([0.9, None, 0.7, 0.6]):
+            run_id = store.create_run(session_id=session_id, config_json="{}", iteration=i + 1)
+            if loss is not None:
+                store.log_metrics(run_id, {"loss": loss, "accuracy": 0.5})
+
+        assert store.get_metric_history(session_id, "loss") == [0.9, 0.7, 0.6]
+        assert store.get_metric_history(session_id, "loss", limit=2) == [0.7, 0.6]
+        assert store.get_metric_history(session_id, "missing") == []
+
 
 class TestDecisionTracking:
     def test_attach_decision(self, store):
@@ -285,3 +461,40 @@ class TestDecisionTracking:
 
         decisions = store.get_decisions(run_id)
         assert decisions[0].commit_sha == "abc123def456"
+
+    def test_get_decisions_bulk(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="bulk-decisions",
+            branch="revis/bulk-decisions",
+            base_sha="jjj000",
+            budget=budget,
+        )
+
+        run1 = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        run2 = store.create_run(session_id=session_id, config_json="{}", iteration=2)
+        store.attach_decision(run1, Decision(action_type="code_patch", rationale="first"))
+        store.attach_decision(run1, Decision(action_type="code_patch", rationale="second"))
+
+        decisions = store.get_decisions_bulk([run1, run2])
+        assert [d.rationale for d in decisions[run1]] == ["first", "second"]
+        assert decisions[run2] == []
+
+
+class TestTraces:
+    def test_get_traces_bulk(self, store):
+        budget = Budget(type="runs", value=5)
+        session_id = store.create_session(
+            name="traces", branch="revis/traces", base_sha="lll222", budget=budget
+        )
+
+        run1 = store.create_run(session_id=session_id, config_json="{}", iteration=1)
+        run2 = store.create_run(session_id=session_id, config_json="{}", iteration=2)
+        store.log_trace(run1, "tool_call", {"tool": "read_file", "args": {"path": "a.py"}})
+        store.log_trace(run1, "tool_result", {"tool": "read_file", "result": "..."})
+
+        traces = store.get_traces_bulk([run1, run2], "tool_call")
+        assert [t["data"]["tool"] for t in traces[run1]] == ["read_file"]
+        assert traces[run2] == []
+
+        assert len(store.get_traces_bulk([run1])[run1]) == 2